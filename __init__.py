@@ -85,7 +85,7 @@ from . properties import M3SceneProperties, M3ObjectProperties
 from . utils.registration import get_core, get_prefs, get_tools, get_pie_menus
 from . utils.registration import register_classes, unregister_classes, register_keymaps, unregister_keymaps, register_icons, unregister_icons, register_msgbus, unregister_msgbus
 from . ui.menus import object_context_menu, mesh_context_menu, add_object_buttons, material_pick_button, outliner_group_toggles, extrude_menu, group_origin_adjustment_toggle, render_menu, render_buttons
-from . handlers import focus_HUD, surface_slide_HUD, update_group, update_asset, update_msgbus, screencast_HUD, increase_lights_on_render_end, decrease_lights_on_render_start, axes_HUD, undo_save
+from . handlers import focus_HUD, surface_slide_HUD, update_group, update_asset, update_msgbus, screencast_HUD, increase_lights_on_render_end, decrease_lights_on_render_start, axes_HUD, undo_save, update_caches, reset_caches
 
 
 def register():
@@ -141,6 +141,7 @@ def register():
     # HANDLERS
 
     bpy.app.handlers.load_post.append(update_msgbus)
+    bpy.app.handlers.load_post.append(reset_caches)
 
     bpy.app.handlers.depsgraph_update_post.append(axes_HUD)
     bpy.app.handlers.depsgraph_update_post.append(focus_HUD)
@@ -148,6 +149,7 @@ def register():
     bpy.app.handlers.depsgraph_update_post.append(update_group)
     bpy.app.handlers.depsgraph_update_post.append(update_asset)
     bpy.app.handlers.depsgraph_update_post.append(screencast_HUD)
+    bpy.app.handlers.depsgraph_update_post.append(update_caches)
 
     bpy.app.handlers.render_init.append(decrease_lights_on_render_start)
     bpy.app.handlers.render_cancel.append(increase_lights_on_render_end)
@@ -155,6 +157,9 @@ def register():
 
     bpy.app.handlers.undo_pre.append(undo_save)
 
+    bpy.app.handlers.undo_post.append(reset_caches)
+    bpy.app.handlers.redo_post.append(reset_caches)
+
 
     # REGISTRATION OUTPUT
 
@@ -171,6 +176,7 @@ def unregister():
     # HANDLERS
 
     bpy.app.handlers.load_post.remove(update_msgbus)
+    bpy.app.handlers.load_post.remove(reset_caches)
 
     from . handlers import axesHUD, focusHUD, surfaceslideHUD, screencastHUD
 
@@ -192,6 +198,7 @@ def unregister():
     bpy.app.handlers.depsgraph_update_post.remove(update_group)
     bpy.app.handlers.depsgraph_update_post.remove(update_asset)
     bpy.app.handlers.depsgraph_update_post.remove(screencast_HUD)
+    bpy.app.handlers.depsgraph_update_post.remove(update_caches)
 
     bpy.app.handlers.render_init.remove(decrease_lights_on_render_start)
     bpy.app.handlers.render_cancel.remove(increase_lights_on_render_end)
@@ -199,6 +206,9 @@ def unregister():
 
     bpy.app.handlers.undo_pre.remove(undo_save)
 
+    bpy.app.handlers.undo_post.remove(reset_caches)
+    bpy.app.handlers.redo_post.remove(reset_caches)
+
     # MSGBUS
 
     unregister_msgbus(owner)
@@ -3,8 +3,12 @@ import os
 from bpy.app.handlers import persistent
 from . utils.draw import draw_axes_HUD, draw_focus_HUD, draw_surface_slide_HUD, draw_screen_cast_HUD
 from . utils.registration import get_prefs, reload_msgbus, get_addon
-from . utils.group import update_group_name, select_group_children
-from . utils.light import adjust_lights_for_rendering, get_area_light_poll
+from . utils.group import update_group_name, select_group_children, is_valid, invalidate_group_index, invalidate_group_name_allocators, check_group_name_allocators, update_group_index_from_depsgraph
+from . utils.collection import invalidate_collection_index
+from . utils.mesh import invalidate_mesh_caches
+from . utils.bmesh import invalidate_boundary_indices
+from . utils.material import invalidate_bevel_shader_materials
+from . utils.light import adjust_lights_for_rendering, get_area_light_poll, invalidate_light_registry
 from . utils.view import sync_light_visibility
 from . utils.system import get_temp_dir
 from . utils.workspace import get_3dview_area, get_3dview_space
@@ -21,6 +25,9 @@ screencastHUD = None
 meshmachine = None
 decalmachine = None
 
+asset_drop_candidates = set()
+asset_drop_lastop = None
+
 
 @persistent
 def update_msgbus(none):
@@ -91,8 +98,62 @@ def update_group(none):
 
 
 @persistent
-def update_asset(none):
-    global meshmachine, decalmachine
+def update_caches(scene, depsgraph):
+    if depsgraph.id_type_updated('COLLECTION'):
+        invalidate_collection_index()
+        invalidate_light_registry()
+
+    elif depsgraph.id_type_updated('LIGHT'):
+        invalidate_light_registry(objects=False)
+
+    # materials may have been assigned, or objects unhidden, so the visible materials need to be collected again
+    # NOTE: material updates are ignored on purpose, as adjusting the bevel nodes causes them itself
+    if depsgraph.id_type_updated('OBJECT') or depsgraph.id_type_updated('COLLECTION'):
+        invalidate_bevel_shader_materials()
+
+    # keep the group index up to date, rather than invalidating it
+    update_group_index_from_depsgraph(scene, depsgraph)
+
+    # removed objects may free up group names
+    check_group_name_allocators()
+
+    # invalidate the cached dimensions and edge indices of meshes, whose geometry has changed
+    meshes = set()
+
+    for update in depsgraph.updates:
+        if update.is_updated_geometry:
+            data = update.id.original
+
+            if isinstance(data, bpy.types.Mesh):
+                meshes.add(data)
+
+            elif isinstance(data, bpy.types.Object) and data.type == 'MESH':
+                meshes.add(data.data)
+
+    if meshes:
+        invalidate_mesh_caches(meshes)
+        invalidate_boundary_indices(meshes)
+
+
+@persistent
+def reset_caches(none):
+    global asset_drop_candidates, asset_drop_lastop
+
+    asset_drop_candidates = set()
+    asset_drop_lastop = None
+
+    invalidate_collection_index()
+    invalidate_group_index()
+    invalidate_group_name_allocators()
+    invalidate_light_registry()
+    invalidate_mesh_caches()
+    invalidate_boundary_indices()
+    invalidate_bevel_shader_materials()
+
+
+@persistent
+def update_asset(scene, depsgraph):
+    global meshmachine, decalmachine, asset_drop_candidates, asset_drop_lastop
 
     if meshmachine is None:
         meshmachine = get_addon('MESHmachine')[0]
@@ -100,41 +161,54 @@ def update_asset(none):
     if decalmachine is None:
         decalmachine = get_addon('DECALmachine')[0]
 
+    if not (meshmachine or decalmachine):
+        return
+
     context = bpy.context
 
+    operators = context.window_manager.operators
+    lastop = operators[-1] if operators else None
+
+    # collect stashes and decal backups, that have just been added to the scene, as they are for instance when appending an asset
+    # NOTE: the asset is appended in an earlier update, than the one the transform_to_mouse op is run in, and there may be any number of updates in between
+    # ####: so keep collecting them until the drop is detected, but start over, once another op has been run in the meantime
+    if lastop and lastop.as_pointer() != asset_drop_lastop and lastop.bl_idname != 'OBJECT_OT_transform_to_mouse':
+        asset_drop_candidates = set()
+
+    asset_drop_lastop = lastop.as_pointer() if lastop else None
+
+    for update in depsgraph.updates:
+        obj = update.id.original
+
+        if isinstance(obj, bpy.types.Object) and ((meshmachine and obj.MM.isstashobj) or (decalmachine and obj.DM.isbackup)):
+            asset_drop_candidates.add(obj)
+
     if context.mode == 'OBJECT':
 
         # avoid AttributeError: 'Context' object has no attribute 'active_object'
         active = getattr(context, 'active_object', None)
 
-        operators = context.window_manager.operators
-
-        if operators:
-            lastop = operators[-1]
+        if lastop:
 
             # unlink MESHmachine stashes and DECALmachine decal backups
             if active and active.type == 'EMPTY' and active.instance_collection and active.instance_type == 'COLLECTION':
-                if (meshmachine or decalmachine) and lastop.bl_idname == 'OBJECT_OT_transform_to_mouse':
+                if lastop.bl_idname == 'OBJECT_OT_transform_to_mouse' and asset_drop_candidates:
                     # print("inserting an asset")
-                    # start = time.time()
 
-                    # for obj in context.scene.objects:
-                    for obj in context.visible_objects:
-                        if meshmachine and obj.MM.isstashobj:
-                            # print(" STASH!")
-
-                            for col in obj.users_collection:
-                                # print(f"  unlinking {obj.name} from {col.name}")
-                                col.objects.unlink(obj)
+                    # only unlink from the scene's collections, never from the asset's own collections
+                    asset_collections = {active.instance_collection, *active.instance_collection.children_recursive}
+                    scene_collections = {scene.collection, *scene.collection.children_recursive} - asset_collections
 
-                        if decalmachine and obj.DM.isbackup:
-                            # print(" DECAL BACKUP!")
+                    # NOTE: candidates collected several updates ago may have been removed in the meantime
+                    for obj in [obj for obj in asset_drop_candidates if is_valid(obj)]:
+                        # print(" STASH or DECAL BACKUP!")
 
-                            for col in obj.users_collection:
+                        for col in obj.users_collection:
+                            if col in scene_collections:
                                 # print(f"  unlinking {obj.name} from {col.name}")
                                 col.objects.unlink(obj)
 
-                    # print(f" MACHIN3tools asset drop check done, after {time.time() - start:.20f} seconds")
+                    asset_drop_candidates = set()
 
             # if lastop.bl_idname == 'OBJECT_OT_drop_named_material':
                 # print("material dropped")
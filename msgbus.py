@@ -1,11 +1,15 @@
 import bpy
 from . utils import registration as r
-from . utils.group import update_group_name
+from . utils.group import update_group_name, update_group_name_allocators
 
 
 def group_name_change():
     active = bpy.context.active_object
 
+    # NOTE: only the active object is known to have been renamed, numbers freed up by renaming others are reclaimed, once objects are removed
+    if active:
+        update_group_name_allocators(active)
+
     if active and active.M3.is_group_empty and r.get_prefs().group_auto_name:
         update_group_name(active)
 
@@ -2,9 +2,10 @@ import bpy
 from bpy.props import BoolProperty, EnumProperty, FloatProperty
 from mathutils import Matrix, Vector, Euler, Quaternion
 from math import radians
+import numpy as np
 from .. utils.math import get_loc_matrix, get_rot_matrix, get_sca_matrix, average_locations
-from .. utils.object import compensate_children, parent, unparent
-from .. utils.draw import draw_mesh_wire, draw_label, update_HUD_location
+from .. utils.object import compensate_children, get_object_snapshot, get_world_z_minima
+from .. utils.draw import draw_label, update_HUD_location, get_mesh_wire_batch, draw_mesh_wire_instances
 from .. utils.mesh import get_coords
 from .. utils.ui import init_cursor, init_status, finish_status
 from .. utils.system import printd
@@ -353,13 +354,19 @@ class Align(bpy.types.Operator):
                 obj.matrix_world = armature.matrix_world @ bone.matrix @ Matrix.Rotation(radians(self.roll_amount if self.roll else 0), 4, 'Y')
 
     def drop_to_floor(self, context, selection):
+        meshes = [obj for obj in selection if obj.type == 'MESH']
+
+        # get the lowest world space vert of all meshes at once
+        matrices, _ = get_object_snapshot(meshes, bounds=False)
+        minima = dict(zip(meshes, get_world_z_minima(meshes, matrices)))
+
         for obj in selection:
             mx = obj.matrix_world
             oldmx = mx.copy()
 
             if obj.type == 'MESH':
-                minz = min((mx @ v.co)[2] for v in obj.data.vertices)
-                mx.translation.z -= minz
+                if not np.isnan(minima[obj]):
+                    mx.translation.z -= minima[obj]
 
             elif obj.type == 'EMPTY':
                 mx.translation.z -= obj.location.z
@@ -434,9 +441,14 @@ class AlignRelative(bpy.types.Operator):
             return active and [obj for obj in context.selected_objects if obj != active]
 
     def draw_VIEW3D(self):
-        for obj in self.targets:
-            for batch in self.batches[obj]:
-                draw_mesh_wire(batch, color=green if self.instance else blue, alpha=0.5)
+
+        # upload each aligner's local space geometry only once, and then draw it for each target
+        if not self.batches:
+            self.batches = {aligner: get_mesh_wire_batch(*coords) for aligner, coords in self.coords.items()}
+
+        for aligner, batch in self.batches.items():
+            matrices = [obj.matrix_world @ self.deltamx[aligner] for obj in self.targets]
+            draw_mesh_wire_instances(batch, matrices, color=green if self.instance else blue, alpha=0.5)
 
     def draw_HUD(self, args):
         context, event = args
@@ -452,11 +464,6 @@ class AlignRelative(bpy.types.Operator):
         # update target object list, usually you could do this only on LEFTMOUSE events, but the retarded, default RELEASE select keymap prevents this
         self.targets = [obj for obj in context.selected_objects if obj not in self.orig_sel]
 
-        # create batches for VIEW3D preview
-        for obj in self.targets:
-            if obj not in self.batches:
-                self.batches[obj] = [get_coords(aligner.data, obj.matrix_world @ self.deltamx[aligner], indices=True) for aligner in self.aligners if aligner.data]
-
         events = ['MOUSEMOVE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE']
 
         if event.type in events:
@@ -489,49 +496,11 @@ class AlignRelative(bpy.types.Operator):
             self.finish()
 
             # create duplicares/instances
-
-            for target in self.targets:
-                self.target_map[target] = {'dups': [],
-                                           'map': {}}
-
-                for aligner in self.aligners:
-                    dup = aligner.copy()
-
-                    # collect dups and their relation to the original aligners
-                    self.target_map[target]['dups'].append(dup)
-                    self.target_map[target]['map'][aligner] = dup
-                    # self.target_map[target]['map'][dup] = aligner
-
-                    if aligner.data:
-                        dup.data = aligner.data if self.instance else aligner.data.copy()
-
-                    dup.matrix_world = target.matrix_world @ self.deltamx[aligner]
-
-                    for col in aligner.users_collection:
-                        col.objects.link(dup)
-
+            self.create_duplicates()
 
             if self.debug:
                 printd(self.target_map, name='target map')
 
-            for target, dup_data in self.target_map.items():
-                if self.debug:
-                    print(target.name)
-
-                for dup in dup_data['dups']:
-                    if self.debug:
-                        print("", dup.name, " > ", dup_data['map'][dup].name)
-
-                    # re-parent the dup if necessary to the target or another dup
-                    self.reparent(dup_data, target, dup, debug=self.debug)
-
-                    # re-mirror the dup if necessary to the target or another dup
-                    self.remirror(dup_data, target, dup, debug=self.debug)
-
-                    # re-group the dup if necessary
-                    self.regroup(dup_data, target, dup, debug=self.debug)
-
-
             # select only the new dups
             bpy.ops.object.select_all(action='DESELECT')
 
@@ -578,9 +547,12 @@ class AlignRelative(bpy.types.Operator):
 
         self.orig_sel = [self.active] + self.aligners
         self.targets = []
-        self.batches = {}
         self.target_map = {}
 
+        # get the local space coords of the aligners for the VIEW3D preview, the gpu batches are then created from them when first drawn
+        self.coords = {aligner: get_coords(aligner.data, indices=True) for aligner in self.aligners if aligner.type == 'MESH'}
+        self.batches = {}
+
         # get the deltamatrices, representing the relativ transforms
         self.deltamx = {obj: self.active.matrix_world.inverted_safe() @ obj.matrix_world for obj in self.aligners}
         # printd(self.deltamx)
@@ -601,57 +573,102 @@ class AlignRelative(bpy.types.Operator):
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
-    def reparent(self, dup_data, target, dup, debug=False):
+    def create_duplicates(self):
         '''
-        check if the dup is parented to the reference object or one of the other aligners
-        and if so, reparerent accordingly to either the target, or the aligner dup
+        create the duplicates or instances of all aligners for all targets in one go
+        the world matrices of all dups are computed at once, and re-parenting, re-mirroring and re-grouping are resolved from lookup tables prepared once per aligner, instead of per dup
+            dups of aligners parented to the reference or another aligner, are re-parented to the target or the other aligner's dup
+            dups of aligners mirrored across the reference or another aligner, are re-mirrored across the target or the other aligner's dup
+            dups of aligners in the same group as the reference, are re-grouped into the target's group, if the target is in a group too
         '''
 
-        if dup.parent and dup.parent in self.orig_sel:
-            if dup.parent == self.active:
-                pobj = target
+        active = self.active
+        aligners = self.aligners
+        orig_sel = set(self.orig_sel)
 
-                if debug:
-                    print("  duplicate is parented to reference", dup.parent.name)
+        # world matrices of all dups, for all targets and aligners
+        target_mxs = np.array([target.matrix_world for target in self.targets], dtype=float).reshape(-1, 4, 4)
+        delta_mxs = np.array([self.deltamx[aligner] for aligner in aligners], dtype=float).reshape(-1, 4, 4)
+        dup_mxs = target_mxs[:, None] @ delta_mxs[None]
 
-            else:
-                pobj = dup_data['map'][dup.parent]
-                if debug:
-                    print("  duplicate is parented to another aligner", dup.parent.name)
+        # LOOKUP TABLES
 
-            unparent(dup)
-            parent(dup, pobj)
+        indices = {aligner: idx for idx, aligner in enumerate(aligners)}
 
-    def remirror(self, dup_data, target, dup, debug=False):
-        '''
-        check if the dup is mirrored across the reference object or one of the other aligners
-        and if so, remirror accordingly across either the target, or the aligner dup
-        '''
+        # aligners parented to the reference object or another aligner
+        parents = {aligner: aligner.parent for aligner in aligners if aligner.parent and aligner.parent in orig_sel}
 
-        mirrors = [mod for mod in dup.modifiers if mod.type == 'MIRROR' and mod.mirror_object in self.orig_sel]
+        # aligners mirrored across the reference object or other aligners
+        mirrors = {aligner: [(mod.name, mod.mirror_object) for mod in aligner.modifiers if mod.type == 'MIRROR' and mod.mirror_object in orig_sel] for aligner in aligners}
 
-        for mod in mirrors:
-            if mod.mirror_object == self.active:
-                mobj = target
-                if debug:
-                    print("  duplicate is mirrored accross reference", mod.mirror_object.name)
+        # aligners in the same group as the reference object
+        is_active_grouped = active.M3.is_group_object and active.parent and active.parent.M3.is_group_empty
+        grouped = {aligner for aligner in aligners if is_active_grouped and aligner not in parents and aligner.M3.is_group_object and aligner.parent == active.parent}
 
-            else:
-                mobj = dup_data['map'][mod.mirror_object]
-                if debug:
-                    print("  duplicate is mirrored accross another aligner", mod.mirror_object.name)
+        collections = {aligner: list(aligner.users_collection) for aligner in aligners}
 
-            mod.mirror_object = mobj
 
-    def regroup(self, dup_data, target, dup, debug=False):
-        '''
-        re-group, if the dup is in the same group as the reference, and the target is also in a group
-        '''
+        # CREATE
+
+        links = {}
+
+        for target in self.targets:
+            dup_map = {}
+
+            for aligner in aligners:
+                dup = aligner.copy()
+
+                if aligner.data:
+                    dup.data = aligner.data if self.instance else aligner.data.copy()
+
+                dup_map[aligner] = dup
+
+                for col in collections[aligner]:
+                    links.setdefault(col, []).append(dup)
+
+            self.target_map[target] = {'dups': list(dup_map.values()),
+                                       'map': dup_map}
+
+
+        # LINK, one collection at a time
+
+        for col, dups in links.items():
+            for dup in dups:
+                col.objects.link(dup)
+
+
+        # TRANSFORM, RE-PARENT, RE-MIRROR and RE-GROUP
+
+        for tidx, (target, dup_data) in enumerate(self.target_map.items()):
+            dup_map = dup_data['map']
+            is_target_grouped = target.M3.is_group_object and target.parent and target.parent.M3.is_group_empty
+
+            for aligner, dup in dup_map.items():
+                mx = Matrix(dup_mxs[tidx, indices[aligner]].tolist())
+
+                if aligner in parents:
+                    if parents[aligner] == active:
+                        pobj = target
+                        pmx = target.matrix_world
+                    else:
+                        pobj = dup_map[parents[aligner]]
+                        pmx = Matrix(dup_mxs[tidx, indices[parents[aligner]]].tolist())
+
+                elif aligner in grouped and is_target_grouped:
+                    pobj = target.parent
+                    pmx = pobj.matrix_world
+
+                else:
+                    pobj = None
+
+                # with the parent inverse being the inverted parent matrix, the basis matrix is the world matrix
+                if pobj:
+                    dup.parent = pobj
+                    dup.matrix_parent_inverse = pmx.inverted_safe()
+                    dup.matrix_basis = mx
 
-        if target.M3.is_group_object and target.parent and target.parent.M3.is_group_empty:
-            if (dup.M3.is_group_object and self.active.M3.is_group_object) and (dup.parent and self.active.parent) and (dup.parent.M3.is_group_empty and self.active.parent.M3.is_group_empty) and (dup.parent == self.active.parent):
-                if debug:
-                    print("  regrouping to", target.name)
+                else:
+                    dup.matrix_world = mx
 
-                unparent(dup)
-                parent(dup, target.parent)
+                for name, mirror_obj in mirrors[aligner]:
+                    dup.modifiers[name].mirror_object = target if mirror_obj == active else dup_map[mirror_obj]
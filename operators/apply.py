@@ -3,6 +3,8 @@ from bpy.props import BoolProperty
 from mathutils import Vector, Quaternion
 from .. utils.registration import get_addon
 from .. utils.math import flatten_matrix, get_loc_matrix, get_rot_matrix, get_sca_matrix
+from .. utils.mesh import transform_mesh
+from .. utils.object import get_data_users
 
 
 # TODO: updare child parent inverse mx?
@@ -39,10 +41,17 @@ class Apply(bpy.types.Operator):
             # only apply the scale to objects, that arent't parented themselves
             apply_objs = [obj for obj in context.selected_objects if not obj.parent]
 
-            for obj in apply_objs:
+            # the mesh level and the object level transformations of each object
+            transforms = {}
+
+            # the children of all objects and their current world mx, they are restored once all objects have been applied
+            children = []
 
-                # fetch children and their current world mx
-                children = [(child, child.matrix_world) for child in obj.children]
+            # the objects of each data block, grouped by mesh level transformation, so each data block is only transformed once
+            data_users = {}
+
+            for obj in apply_objs:
+                children.extend((child, child.matrix_world.copy(), obj) for child in obj.children)
 
                 mx = obj.matrix_world
                 loc, rot, sca = mx.decompose()
@@ -55,8 +64,6 @@ class Apply(bpy.types.Operator):
                 elif self.scale:
                     meshmx = get_sca_matrix(sca)
 
-                obj.data.transform(meshmx)
-
                 # zero out the transformations on the object level
                 if self.rotation and self.scale:
                     applymx = get_loc_matrix(loc) @ get_rot_matrix(Quaternion()) @ get_sca_matrix(Vector.Fill(3, 1))
@@ -65,8 +72,38 @@ class Apply(bpy.types.Operator):
                 elif self.scale:
                     applymx = get_loc_matrix(loc) @ get_rot_matrix(rot) @ get_sca_matrix(Vector.Fill(3, 1))
 
-                obj.matrix_world = applymx
+                transforms[obj] = meshmx, applymx, sca
+
+                if obj.data:
+                    key = tuple(round(i, 6) for i in flatten_matrix(meshmx))
+                    data_users.setdefault(obj.data, {}).setdefault(key, []).append(obj)
+
+
+            # data used by objects that aren't applied, can't be transformed in place, or those objects would change too
+            # NOTE: data.users also counts fake users and other references, so it only tells which data needs to have its object users counted
+            counts = {data: sum(len(objs) for objs in groups.values()) for data, groups in data_users.items()}
+            object_users = get_data_users([data for data, count in counts.items() if data.users > count])
+
+            # transform each data block only once
+            for data, groups in data_users.items():
+                is_shared = data in object_users and len(object_users[data]) > counts[data]
 
+                for idx, objs in enumerate(groups.values()):
+
+                    # objects sharing data, but with different transformations, each get their own copy, which is then shared among the objects with the same transformation
+                    if idx or is_shared:
+                        print(f"INFO: Splitting off {data.name} for {', '.join(obj.name for obj in objs)}, as it is shared with differently transformed objects")
+
+                        copy = data.copy()
+
+                        for obj in objs:
+                            obj.data = copy
+
+                    self.transform_data(objs[0].data, transforms[objs[0]][0])
+
+
+            for obj, (meshmx, applymx, sca) in transforms.items():
+                obj.matrix_world = applymx
 
                 # adjust the bevel width values accordingly
                 if self.scale:
@@ -77,13 +114,24 @@ class Apply(bpy.types.Operator):
                         mod.width = vwidth[2]
 
 
-                # reset the children to their original state again
-                for obj, mxw in children:
-                    obj.matrix_world = mxw
+            # reset the children to their original state again, all at once
+            for child, mxw, parentobj in children:
+                child.matrix_world = mxw
 
-                    # update decal backups's backup matrices as well, we can just reuse the bmesh mx here
-                    if decalmachine and obj.DM.decalbackup:
-                        backup = obj.DM.decalbackup
-                        backup.DM.backupmx = flatten_matrix(meshmx @ backup.DM.backupmx)
+                # update decal backups's backup matrices as well, we can just reuse the parent's mesh mx here
+                if decalmachine and child.DM.decalbackup:
+                    backup = child.DM.decalbackup
+                    backup.DM.backupmx = flatten_matrix(transforms[parentobj][0] @ backup.DM.backupmx)
 
         return {'FINISHED'}
+
+    def transform_data(self, data, mx):
+        '''
+        meshes are transformed in bulk, any other data with a transform() method, like curves, lattices or armatures, is transformed natively
+        '''
+
+        if isinstance(data, bpy.types.Mesh):
+            transform_mesh(data, mx)
+
+        elif hasattr(data, 'transform'):
+            data.transform(mx)
@@ -2,7 +2,7 @@ import bpy
 import bmesh
 from bpy.props import BoolProperty, EnumProperty, IntProperty
 from .. utils.registration import get_prefs, get_addon
-from .. utils.view import update_local_view
+from .. utils.view import update_local_view, add_focus_epoch, get_focus_epoch_hidden
 from .. items import focus_method_items, focus_levels_items
 
 
@@ -102,12 +102,10 @@ class Focus(bpy.types.Operator):
     def local_view(self, context, debug=False):
         def focus(context, view, sel, history, init=False, invert=False, lights=[]):
             vis = context.visible_objects
-            hidden = [obj for obj in vis if obj not in sel]
 
-            # remove lights from hidden objects, if lights are passed in, they shouldn#t be hidden
-            for obj in lights:
-                if obj in hidden:
-                    hidden.remove(obj)
+            # lights are kept visible as well, if lights are passed in, they shouldn#t be hidden
+            visible = set(sel) | set(lights)
+            hidden = [obj for obj in vis if obj not in visible]
 
             # print("\nhidden")
             # for obj in hidden:
@@ -132,15 +130,8 @@ class Focus(bpy.types.Operator):
                 else:
                     update_local_view(view, [(obj, False) for obj in hidden])
 
-                # create new epoch
-                epoch = history.add()
-                epoch.name = "Epoch %d" % (len(history) - 1)
-
-                # store hidden objects in epoch
-                for obj in hidden:
-                    entry = epoch.objects.add()
-                    entry.obj = obj
-                    entry.name = obj.name
+                # create new epoch, storing the visible objects, rather than the (usually many more) hidden ones
+                epoch = add_focus_epoch(history, [obj for obj in vis if obj in visible], hidden)
 
                 # disable mirror mods and store these unmirrored objects
                 if self.unmirror:
@@ -165,8 +156,7 @@ class Focus(bpy.types.Operator):
         def unfocus(context, view, history):
             last_epoch = history[-1]
 
-            # get obj used for selection event to force a HUD drawing/handler update
-            obj = last_epoch.objects[0].obj
+            hidden = get_focus_epoch_hidden(history)
 
             # de-inititalize
             if len(history) == 1:
@@ -174,7 +164,7 @@ class Focus(bpy.types.Operator):
 
             # unhide
             else:
-                update_local_view(view, [(entry.obj, True) for entry in last_epoch.objects])
+                update_local_view(view, [(obj, True) for obj in hidden])
 
             # re-enbable mirror mods
             for entry in last_epoch.unmirrored:
@@ -187,7 +177,12 @@ class Focus(bpy.types.Operator):
             history.remove(idx)
 
             # selection event to force a HUD drawing/handler update
-            obj.select_set(False)
+            if hidden:
+                hidden[0].select_set(False)
+
+            elif context.visible_objects:
+                obj = context.visible_objects[0]
+                obj.select_set(obj.select_get())
 
         view = context.space_data
         # self.show_tool_props = False
@@ -203,7 +198,8 @@ class Focus(bpy.types.Operator):
             sel = context.selected_objects
 
         # get lights, not in the selection
-        lights = [obj for obj in vis if obj.type == 'LIGHT' and obj not in sel] if get_prefs().focus_lights else []
+        selected = set(sel)
+        lights = [obj for obj in vis if obj.type == 'LIGHT' and obj not in selected] if get_prefs().focus_lights else []
 
         # print("\nlights")
         # for obj in lights:
@@ -269,4 +265,4 @@ class Focus(bpy.types.Operator):
 
             if debug:
                 for epoch in history:
-                    print(epoch.name, ", hidden: ", [obj.name for obj in epoch.objects], ", unmirrored: ", [obj.name for obj in epoch.unmirrored])
+                    print(epoch.name, ", visible: ", [obj.name for obj in epoch.visible], ", hidden: ", [obj.name for obj in epoch.objects], ", unmirrored: ", [obj.name for obj in epoch.unmirrored])
@@ -1,5 +1,7 @@
 import bpy
 from bpy.props import EnumProperty, BoolProperty
+from collections import deque
+from time import time
 from .. utils.object import parent, unparent
 from .. utils.group import group, ungroup, get_group_matrix, select_group_children, get_child_depth, clean_up_groups, fade_group_sizes
 from .. utils.collection import get_collection_depth
@@ -268,39 +270,59 @@ class Groupify(bpy.types.Operator):
             return [obj for obj in context.selected_objects if obj.type == 'EMPTY' and not obj.M3.is_group_empty and obj.children]
 
     def execute(self, context):
+        start = time()
+
         all_empties = [obj for obj in context.selected_objects if obj.type == 'EMPTY' and not obj.M3.is_group_empty and obj.children]
 
         # only take the top level empties
         empties = [e for e in all_empties if e.parent not in all_empties]
 
         # groupify all the way down
-        self.groupify(empties)
+        groups = self.groupify(empties)
 
         # fade group sizes
         if get_prefs().group_fade_sizes:
             fade_group_sizes(context, init=True)
 
+        print(f"INFO: Groupified {len(empties)} {'hierarchy' if len(empties) == 1 else 'hierarchies'} into {groups} groups, in {time() - start:.2f} seconds")
+
         return {'FINISHED'}
 
     def groupify(self, objects):
-        for obj in objects:
+        '''
+        groupify entire hierarchies breadth first, rather than recursively, the group props and empty display settings are still written per object
+        NOTE: the hierarchy itself is left untouched, so no relations need to be rebuilt until the op is done
+        '''
+
+        group_size = get_prefs().group_size
+        groups = 0
+
+        queue = deque(objects)
+
+        while queue:
+            obj = queue.popleft()
+
             if obj.type == 'EMPTY' and not obj.M3.is_group_empty and obj.children:
                 obj.M3.is_group_empty = True
                 obj.M3.is_group_object = True if obj.parent and obj.parent.M3.is_group_empty else False
                 obj.show_in_front = True
                 obj.empty_display_type = 'CUBE'
-                obj.empty_display_size = get_prefs().group_size
+                obj.empty_display_size = group_size
                 obj.show_name = True
 
                 if not any([s in obj.name.lower() for s in ['grp', 'group']]):
                     obj.name = f"{obj.name}_GROUP"
 
+                groups += 1
+
                 # do it all the way down
-                self.groupify(obj.children)
+                queue.extend(obj.children)
 
             else:
                 obj.M3.is_group_object = True
 
+        return groups
+
 
 # SELECT / DUPLICATE
 
@@ -709,11 +731,11 @@ class CollapseOutliner(bpy.types.Operator):
     def execute(self, context):
 
         # get collection depth
-        col_depth = get_collection_depth(self, [context.scene.collection], init=True)
+        col_depth = get_collection_depth(context.scene)
         # print("collection depth", col_depth)
 
-        # get child depth
-        child_depth = get_child_depth(self, [obj for obj in context.scene.objects if obj.children], init=True)
+        # get child depth, starting from the root objects is enough to find the deepest hierarchy
+        child_depth = get_child_depth(self, [obj for obj in context.scene.objects if obj.children and not obj.parent], init=True)
         # print("child depth", child_depth)
 
         # collapse the max amount of the two, plus once more, in case meshes are expanded too
@@ -739,7 +761,7 @@ class ExpandOutliner(bpy.types.Operator):
         bpy.ops.outliner.show_hierarchy()
 
         # get collection depth
-        depth = get_collection_depth(self, [context.scene.collection], init=True)
+        depth = get_collection_depth(context.scene)
 
         # expand collections
         for i in range(depth):
@@ -9,6 +9,7 @@ from .. utils.registration import get_prefs
 from .. utils.system import printd
 from .. utils.ui import init_cursor, init_status, finish_status
 from .. utils.asset import get_asset_details_from_space
+from .. utils.append import append_material
 from .. items import alt, ctrl
 from .. colors import white, yellow, green, red
 
@@ -390,13 +391,13 @@ class MaterialPicker(bpy.types.Operator):
                     # check if the blend path actually exists, if you switch libraries without making a new selection, it's possible to have get a libpath and blend file that don't match
                     if os.path.exists(os.path.join(libpath, blendname)):
 
-                        directory = os.path.join(libpath, blendname, 'Material')
-                        # print("directory:", directory)
+                        blendpath = os.path.join(libpath, blendname)
+                        # print("blendpath:", blendpath)
 
                         asset = {'error': None,
                                  'import_type': import_type.title().replace('_', ' '),
                                  'library': libname,
-                                 'directory': directory,
+                                 'blend_path': blendpath,
                                  'blend_name': blendname.replace('.blend', ''),
                                  'material_name': matname}
 
@@ -476,41 +477,27 @@ class MaterialPicker(bpy.types.Operator):
 
     def get_material_from_assetbrowser(self, context):
         import_type = self.asset['import_type']
-        directory = self.asset['directory']
+        blendpath = self.asset['blend_path']
         filename = self.asset['material_name']
 
         # print("\nassset browser material import")
         mat = bpy.data.materials.get(filename)
 
-        # only append/link if a material of that name doesn't exist already
+        # only append/link if a material of that name doesn't exist already, which also covers the Append (Reuse Data) import type
         if not mat:
             # print(" import type:", import_type)
-            # print(" directory:", directory)
+            # print(" blendpath:", blendpath)
             # print(" filename:", filename)
 
-            # cant append/link in edit mode, gotta switch to object mode
-            iseditmode = context.mode == 'EDIT_MESH'
-
-            if iseditmode:
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-            if 'Append' in import_type:
-                reuse_local_id= 'Reuse' in import_type
-                bpy.ops.wm.append(directory=directory, filename=filename, do_reuse_local_id=reuse_local_id)
-
-            else:
-                bpy.ops.wm.link(directory=directory, filename=filename)
-
-            # switch back
-            if iseditmode:
-                bpy.ops.object.mode_set(mode='EDIT')
+            # NOTE: unlike the wm.append and wm.link ops, loading from the library directly works in edit mode too, so there's no need to switch modes
+            link = 'Append' not in import_type
 
             # fetch the imported material so it can be assigned
-            mat = bpy.data.materials.get(filename)
+            mat = append_material(blendpath, filename, link=link)
             # print(" imported material:", mat)
 
             # disable fake user
-            if mat.use_fake_user:
+            if mat and not mat.library and mat.use_fake_user:
                 mat.use_fake_user = False
 
         return mat
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import BoolProperty, EnumProperty
 from bpy_extras.view3d_utils import region_2d_to_location_3d, region_2d_to_origin_3d, region_2d_to_vector_3d
 from mathutils import Vector
+import numpy as np
 from .. utils.registration import get_addon, get_prefs
 from .. utils.tools import get_active_tool
 from .. utils.object import parent, unparent, get_eval_bbox
@@ -523,12 +524,16 @@ class Mirror(bpy.types.Operator):
         find empties in the scene, that match the current cursor matrix
         '''
 
-        scene = context.scene
+        empties = [obj for obj in context.scene.objects if obj.type == 'EMPTY']
+
+        if empties:
 
-        matching_empties = [obj for obj in scene.objects if obj.type == 'EMPTY' and compare_matrix(obj.matrix_world, self.cmx, precision=5)]
+            # compare the candidate empties' matrices at once, rounded like compare_matrix() does it
+            matrices = np.array([obj.matrix_world for obj in empties])
+            matching = np.all(np.round(matrices, 5) == np.round(np.array(self.cmx), 5), axis=(1, 2))
 
-        if matching_empties:
-            return matching_empties[0]
+            if matching.any():
+                return empties[int(matching.argmax())]
 
     def get_mirror_mods(self, objects):
         '''
@@ -601,21 +606,33 @@ class Mirror(bpy.types.Operator):
             if not self.cursor:
                 sel.remove(active)
 
+            mirror_object = empty if self.cursor else active
+
+            # the first instance of each instance collection, so collections instanced multiple times in the selection are mirrored only once
+            instances = {}
+
             for obj in sel:
                 if obj.type in ["MESH", "CURVE"]:
-                    self.mirror_mesh_obj(context, obj, mirror_object=empty if self.cursor else active)
+                    self.mirror_mesh_obj(context, obj, mirror_object=mirror_object)
 
                 elif obj.type == "GPENCIL":
-                    self.mirror_gpencil_obj(context, obj, mirror_object=empty if self.cursor else active)
+                    self.mirror_gpencil_obj(context, obj, mirror_object=mirror_object)
 
-                elif obj.type == "EMPTY" and obj.instance_collection:
-                    self.mirror_instance_collection(context, obj, mirror_object=empty if self.cursor else active)
+                elif obj.type == "EMPTY" and obj.instance_collection and obj.instance_collection not in instances:
+                    instances[obj.instance_collection] = obj
+
+            for obj in instances.values():
+                self.mirror_instance_collection(context, obj, mirror_object=mirror_object)
 
     def mirror_mesh_obj(self, context, obj, mirror_object=None):
         mirror = obj.modifiers.new(name="Mirror", type="MIRROR")
         mirror.use_axis = (self.use_x, self.use_y, self.use_z)
-        mirror.use_bisect_axis = (self.bisect_x, self.bisect_y, self.bisect_z)
-        mirror.use_bisect_flip_axis = (self.flip_x, self.flip_y, self.flip_z)
+
+        # the bisect and flip props default to False, so they only need to be set, when they are actually used
+        if any([self.bisect_x, self.bisect_y, self.bisect_z, self.flip_x, self.flip_y, self.flip_z]):
+            mirror.use_bisect_axis = (self.bisect_x, self.bisect_y, self.bisect_z)
+            mirror.use_bisect_flip_axis = (self.flip_x, self.flip_y, self.flip_z)
+
         mirror.show_expanded = False
 
         if mirror_object:
@@ -1,7 +1,7 @@
 import bpy
 from bpy.props import EnumProperty, BoolProperty
-from mathutils import Vector
 from .. utils.modifier import get_mod_obj
+from .. utils.object import get_object_snapshot, get_world_bounds
 # from .. items import axis_items
 
 
@@ -39,12 +39,14 @@ class SelectCenterObjects(bpy.types.Operator):
 
             bpy.ops.object.select_all(action='DESELECT')
 
-            for obj in visible:
-                mx = obj.matrix_world
+            matrices, bboxes = get_object_snapshot(visible)
+            mins, maxs = get_world_bounds(matrices, bboxes)
 
-                coords = [(mx @ Vector(co))[int(self.axis)] for co in obj.bound_box]
+            axis = int(self.axis)
+            center = (mins[:, axis] < 0) & (maxs[:, axis] > 0)
 
-                if min(coords) < 0 and max(coords) > 0:
+            for obj, is_center in zip(visible, center):
+                if is_center:
                     obj.select_set(True)
 
         return {'FINISHED'}
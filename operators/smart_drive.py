@@ -1,9 +1,23 @@
 import bpy
-from bpy.props import StringProperty
-from math import radians, degrees
+from bpy.props import StringProperty, IntProperty
+from math import radians, degrees, isfinite
+from time import time
 from .. items import axis_mapping_dict
 
 
+def format_value(value):
+    '''
+    format a float as a plain literal the simple expression evaluator can parse, f-strings can produce inf or nan, which are just names to the driver
+    '''
+
+    value = float(value)
+
+    if not isfinite(value):
+        raise ValueError(f"Can't use non-finite value {value} in a driver expression")
+
+    return repr(value)
+
+
 class SmartDrive(bpy.types.Operator):
     bl_idname = 'machin3.smart_drive'
     bl_label = 'MACHIN3: Smart Drive'
@@ -59,6 +73,9 @@ class SmartDrive(bpy.types.Operator):
         drv = fcurve.driver
         drv.type = 'SCRIPTED'
 
+        # NOTE: drivers using self are always evaluated by Python
+        drv.use_self = False
+
         # add control variable, controlled by driver object
         var = drv.variables.new()
         var.name = path[:3]
@@ -82,7 +99,13 @@ class SmartDrive(bpy.types.Operator):
             driven_end = radians(driven_end)
 
         # set expression
-        drv.expression = self.get_expression(driver_start, driver_end, driven_start, driven_end, driven_limit, var.name)
+        expr = self.get_expression(driver_start, driver_end, driven_start, driven_end, driven_limit, var.name)
+
+        drv.expression = expr
+
+        # check if Blender evaluates the expression natively, which also requires the driver's variables to be valid
+        if not drv.is_simple_expression:
+            self.report({'WARNING'}, f"Driver expression '{expr}' on {driven.name}'s {path}[{index}] is not a simple expression and will be evaluated by Python")
 
         return {'FINISHED'}
 
@@ -91,53 +114,111 @@ class SmartDrive(bpy.types.Operator):
         create expression based on driver and driven values and limit
         '''
 
-        range_driver = abs(driver_end - driver_start)
-        range_driven = abs(driven_end - driven_start)
+        # format all values up front, so only plain float literals end up in the expression
+        range_driver = format_value(abs(driver_end - driver_start))
+        range_driven = format_value(abs(driven_end - driven_start))
+
+        driver_start_str = format_value(driver_start)
+        driven_start_str = format_value(driven_start)
+        driven_end_str = format_value(driven_end)
 
         # driver end value is bigger than end value!
         if driver_end > driver_start:
-            expr = f'((({varname} - {driver_start}) / {range_driver}) * {range_driven})'
+            expr = f'((({varname} - {driver_start_str}) / {range_driver}) * {range_driven})'
 
         # driven start value is bigger than end value!
         else:
-            expr = f'((({driver_start} - {varname}) / {range_driver}) * {range_driven})'
+            expr = f'((({driver_start_str} - {varname}) / {range_driver}) * {range_driven})'
 
         # driven end value is bigger than end value!
         if driven_end > driven_start:
-            expr = f'{expr} + {driven_start}'
+            expr = f'{expr} + {driven_start_str}'
 
             # limit the start value
             if driven_limit == 'START':
-                expr = f'max({driven_start}, {expr})'
+                expr = f'max({driven_start_str}, {expr})'
 
             # limit the end value
             elif driven_limit == 'END':
-                expr = f'min({driven_end}, {expr})'
+                expr = f'min({driven_end_str}, {expr})'
 
             # limit start and end
             elif driven_limit == 'BOTH':
-                expr = f'max({driven_start}, min({driven_end}, {expr}))'
+                expr = f'max({driven_start_str}, min({driven_end_str}, {expr}))'
 
 
         # driven start value is bigger than end value!
         else:
-            expr = f'{driven_start} - {expr}'
+            expr = f'{driven_start_str} - {expr}'
 
             # limit the start value
             if driven_limit == 'START':
-                expr = f'min({driven_start}, {expr})'
+                expr = f'min({driven_start_str}, {expr})'
 
             # limit the end value
             elif driven_limit == 'END':
-                expr = f'max({driven_end}, {expr})'
+                expr = f'max({driven_end_str}, {expr})'
 
             # limit start and end
             elif driven_limit == 'BOTH':
-                expr = f'min({driven_start}, max({driven_end}, {expr}))'
+                expr = f'min({driven_start_str}, max({driven_end_str}, {expr}))'
 
         return expr
 
 
+class BenchmarkDrivers(bpy.types.Operator):
+    bl_idname = 'machin3.benchmark_drivers'
+    bl_label = 'MACHIN3: Benchmark Drivers'
+    bl_description = 'Play back Frames twice, first with all Simple Expression Drivers in the Scene forced onto the Python Path, then natively, and report the Driver Evaluation Cost of both'
+    bl_options = {'REGISTER'}
+
+    frames: IntProperty(name="Frames", description="Number of Frames to play back for each Benchmark Run", default=100, min=1)
+
+    def execute(self, context):
+        scene = context.scene
+
+        drivers = [fcurve.driver for obj in scene.objects if obj.animation_data for fcurve in obj.animation_data.drivers if fcurve.driver.type == 'SCRIPTED' and fcurve.driver.is_simple_expression]
+
+        if not drivers:
+            self.report({'INFO'}, "There are no simple expression drivers to benchmark")
+            return {'CANCELLED'}
+
+        # NOTE: with auto run scripts disabled or blocked, Python drivers aren't evaluated at all, so there is nothing to compare
+        if not context.preferences.filepaths.use_scripts_auto_execute or bpy.app.autoexec_fail:
+            self.report({'WARNING'}, "Python drivers are not executed, enable Auto Run Python Scripts to benchmark them")
+            return {'CANCELLED'}
+
+        current_frame = scene.frame_current
+        frames = range(scene.frame_start, scene.frame_start + self.frames)
+
+        def playback():
+            start = time()
+
+            for frame in frames:
+                scene.frame_set(frame)
+
+            return time() - start
+
+        # NOTE: use_self disables the simple expression evaluator
+        for drv in drivers:
+            drv.use_self = True
+
+        python_time = playback()
+
+        for drv in drivers:
+            drv.use_self = False
+
+        simple_time = playback()
+
+        scene.frame_set(current_frame)
+
+        text = f"{len(drivers)} simple expression drivers over {len(frames)} frames: {python_time:.4f}s via Python, {simple_time:.4f}s natively ({(python_time - simple_time) / len(frames) * 1000:.3f}ms per frame saved)"
+        print(f"INFO: {text}")
+        self.report({'INFO'}, text)
+
+        return {'FINISHED'}
+
+
 class SwitchValues(bpy.types.Operator):
     bl_idname = 'machin3.switch_driver_values'
     bl_label = 'MACHIN3: Switch Driver Values'
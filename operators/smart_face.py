@@ -1,7 +1,8 @@
 import bpy
 from bpy.props import BoolProperty
 import bmesh
-from .. utils.view import update_local_view
+from .. utils.bmesh import get_boundary_index, find_boundary_vert, update_boundary_index
+from .. utils.view import update_local_view, add_focus_epoch
 from .. utils.registration import get_prefs
 
 
@@ -89,7 +90,8 @@ class SmartFace(bpy.types.Operator):
         history = context.scene.M3.focus_history
 
         vis = context.visible_objects
-        hidden = [obj for obj in vis if obj != context.active_object]
+        active = context.active_object
+        hidden = [obj for obj in vis if obj != active]
 
         # already in local view
         if view.local_view:
@@ -103,15 +105,8 @@ class SmartFace(bpy.types.Operator):
 
             bpy.ops.view3d.localview(frame_selected=False)
 
-        # create new epoch
-        epoch = history.add()
-        epoch.name = "Epoch %d" % (len(history) - 1)
-
-        # store hidden objects in epoch
-        for obj in hidden:
-            entry = epoch.objects.add()
-            entry.obj = obj
-            entry.name = obj.name
+        # create new epoch, storing the visible active object, rather than all the hidden ones
+        add_focus_epoch(history, [active], hidden)
 
     def f3(self, active, bm):
         verts = self.verts
@@ -124,6 +119,10 @@ class SmartFace(bpy.types.Operator):
 
             if faces and len(open_edges) == 2:
 
+                # fetch the cached non-manifold verts, before the geometry is changed, so repeated F3 presses only need to update it
+                if self.automerge:
+                    index = get_boundary_index(active.data, bm)
+
                 # calculate the location of the new vert
                 e1 = open_edges[0]
                 e2 = open_edges[1]
@@ -147,18 +146,22 @@ class SmartFace(bpy.types.Operator):
 
                 # automatically merge the newly created vert to the closest non manifold vert if it's closer than the 2 other verts are
                 if self.automerge:
-                    nonmanifoldverts = [v for v in bm.verts if any([not e.is_manifold for e in v.link_edges]) and v not in [vs, v_new, v1_other, v2_other]]
+                    v_closest, distance = find_boundary_vert(bm, index, v_new.co, exclude={vs, v_new, v1_other, v2_other})
 
-                    if nonmanifoldverts:
-                        distance = min([((v_new.co - v.co).length, v) for v in nonmanifoldverts], key=lambda x: x[0])
+                    if v_closest:
                         threshold = min([(v_new.co - v.co).length * 0.5 for v in [v1_other, v2_other]])
 
-                        if distance[0] < threshold:
-                            v_closest = distance[1]
+                        if distance < threshold:
+
+                            # drop the closest vert from the index, before it's merged away
+                            update_boundary_index(active.data, bm, index, [], removed=[v_closest])
 
                             # merge new to closest, NOTE: in this verts order, the v_new vert stays alive, which is perfect
                             bmesh.ops.pointmerge(bm, verts=[v_new, v_closest], merge_co=v_closest.co)
 
+                    # update the boundary status of the verts affected by the fill and merge
+                    update_boundary_index(active.data, bm, index, [vs, v_new, v1_other, v2_other] + [e.other_vert(v_new) for e in v_new.link_edges])
+
 
                 # if any of the other two verts has 4 edges, at least one of them non-manifold, select it. first come first serve.
                 if any([len(v1_other.link_edges) == 4, len(v2_other.link_edges) == 4]):
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import BoolProperty, StringProperty
 import bmesh
 from math import degrees, radians
+from .. utils.mesh import smooth
 
 
 class ToggleSmooth(bpy.types.Operator):
@@ -52,34 +53,97 @@ class ToggleSmooth(bpy.types.Operator):
         else:
             objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
 
-            toggle_type = 'TOGGLE'
+            subd_objects = []
+            korean_objects = []
 
             for obj in objects:
                 subds = [mod for mod in obj.modifiers if mod.type == 'SUBSURF']
 
                 if subds:
-                    # print("SubD Workflow")
-                    toggle_type = self.toggle_subd(context, obj, subds, toggle_type=toggle_type)
-
+                    subd_objects.append((obj, subds))
                 else:
-                    # print("Korean Bevel Workflow")
-                    toggle_type = self.toggle_korean_bevel(context, obj, toggle_type=toggle_type)
+                    korean_objects.append(obj)
+
+            toggle_type = 'TOGGLE'
+
+            if subd_objects:
+                # print("SubD Workflow")
+                toggle_type = self.toggle_subd_objects(context, subd_objects)
+
+            for obj in korean_objects:
+                # print("Korean Bevel Workflow")
+                toggle_type = self.toggle_korean_bevel(context, obj, toggle_type=toggle_type)
 
         return {'FINISHED'}
 
-    def toggle_subd(self, context, obj, subds, toggle_type='TOGGLE'):
+    def toggle_subd_objects(self, context, objects):
+        '''
+        batch toggle SubD smoothing in object mode
+        the toggle direction is determined once by the first object, face smoothing is then written in bulk per mesh, and the overlays are toggled at the very end
+        '''
+
         self.mode = 'SUBD'
 
-        if obj.mode == 'EDIT':
-            bm = bmesh.from_edit_mesh(obj.data)
-            bm.normal_update()
-            bm.faces.ensure_lookup_table()
+        _, subds = objects[0]
+        toggle_type = 'DISABLE' if subds[0].show_in_editmode and subds[0].show_viewport else 'ENABLE'
+
+        # the new face smoothing state per mesh, collected first, so meshes shared by multiple objects are only written once
+        smoothing = {}
+
+        for obj, subds in objects:
+            mesh = obj.data
+
+            for subd in subds:
+                if not subd.show_on_cage:
+                    subd.show_on_cage = True
+
+            is_enabled = subds[0].show_in_editmode and subds[0].show_viewport
+
+            if toggle_type == 'ENABLE' and not is_enabled:
+
+                # enable face smoothing if necessary
+                if mesh not in smoothing and not mesh.polygons[0].use_smooth:
+                    smoothing[mesh] = True
+                    obj.M3.has_smoothed = True
+
+                for subd in subds:
+                    subd.show_in_editmode = True
+                    subd.show_viewport = True
+
+            elif toggle_type == 'DISABLE' and is_enabled:
+
+                # disable face smoothing if it was enabled before
+                if obj.M3.has_smoothed:
+                    smoothing[mesh] = False
+                    obj.M3.has_smoothed = False
+
+                for subd in subds:
+                    subd.show_in_editmode = False
+                    subd.show_viewport = False
+
+            else:
+                print(f" INFO: SubD Smoothing is {'enabled' if toggle_type == 'ENABLE' else 'disabled'} already for {obj.name}")
+
+        for mesh, state in smoothing.items():
+            smooth(mesh, smooth=state)
+
+        overlay = context.space_data.overlay
+
+        if toggle_type == 'ENABLE':
+            if self.toggle_subd_overlays:
+                overlay.show_overlays = False
 
         else:
-            bm = bmesh.new()
-            bm.from_mesh(obj.data)
-            bm.normal_update()
-            bm.faces.ensure_lookup_table()
+            overlay.show_overlays = True
+
+        return toggle_type
+
+    def toggle_subd(self, context, obj, subds, toggle_type='TOGGLE'):
+        self.mode = 'SUBD'
+
+        bm = bmesh.from_edit_mesh(obj.data)
+        bm.normal_update()
+        bm.faces.ensure_lookup_table()
 
         overlay = context.space_data.overlay
 
@@ -97,11 +161,7 @@ class ToggleSmooth(bpy.types.Operator):
                     for f in bm.faces:
                         f.smooth = True
 
-                    if obj.mode == 'EDIT':
-                        bmesh.update_edit_mesh(obj.data)
-                    else:
-                        bm.to_mesh(obj.data)
-                        bm.free()
+                    bmesh.update_edit_mesh(obj.data)
 
                     obj.M3.has_smoothed = True
 
@@ -125,12 +185,7 @@ class ToggleSmooth(bpy.types.Operator):
                     for f in bm.faces:
                         f.smooth = False
 
-                    if obj.mode == 'EDIT':
-                        bmesh.update_edit_mesh(obj.data)
-
-                    else:
-                        bm.to_mesh(obj.data)
-                        bm.free()
+                    bmesh.update_edit_mesh(obj.data)
 
                     obj.M3.has_smoothed = False
 
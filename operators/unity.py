@@ -4,6 +4,7 @@ from math import radians
 from mathutils import Matrix
 from .. utils.math import flatten_matrix
 from .. utils.modifier import add_triangulate, remove_triangulate
+from .. utils.mesh import transform_mesh
 
 
 class PrepareExport(bpy.types.Operator):
@@ -45,11 +46,17 @@ class PrepareExport(bpy.types.Operator):
         roots = [obj for obj in sel if not obj.parent]
 
         # get direct bone children, they need special treatment
-        bone_children = [obj for obj in sel if obj.parent and obj.parent.type == 'ARMATURE' and obj.parent_bone]
+        bone_children = {obj for obj in sel if obj.parent and obj.parent.type == 'ARMATURE' and obj.parent_bone}
+
+        # the compensated duplicate for each original mesh and armature, so instanced data is only copied and transformed once
+        data_copies = {}
+
+        # the selection as a set, for fast membership checks in the recursion
+        selected = set(sel)
 
         # prepare object transformations and modifiers
         for obj in roots:
-            self.prepare_for_export(obj, sel, matrices, bone_children, triangulate=triangulate)
+            self.prepare_for_export(obj, selected, matrices, bone_children, data_copies, triangulate=triangulate)
 
         if self.prepare_only:
             return {'FINISHED'}
@@ -60,13 +67,14 @@ class PrepareExport(bpy.types.Operator):
 
         return {'FINISHED'}
 
-    def prepare_for_export(self, obj, sel, matrices, bone_children, triangulate=False, depth=0, child=False):
+    def prepare_for_export(self, obj, sel, matrices, bone_children, data_copies, triangulate=False, depth=0, child=False):
         '''
         recursively rotate an object and its children 90 degrees along X
         for meshes, compensate by rotating -90 along X
         also for meshes, store the original meshes for 2 reasons
         1. to easily restore the original mesh rotation
         2. to deal with instanced objects and also be able to restore these
+        instanced meshes and armatures share a single compensated duplicate, so each unique data block is only copied and rotated once
         deal with modifers affecting by the rotations too, like mirror which needs a YZ swivel
         '''
 
@@ -117,13 +125,18 @@ class PrepareExport(bpy.types.Operator):
             '''
 
             # store the original mesh and use a duplicate to be able to deal with instanced object, and to easily restore it later
-            obj.M3.pre_unity_export_mesh = obj.data
-            obj.data = obj.data.copy()
+            mesh = obj.data
+            obj.M3.pre_unity_export_mesh = mesh
 
-            print("INFO: %sadjusting %s's MESH to compensate" % (depth * '  ', obj.name))
+            if mesh in data_copies:
+                print("INFO: %susing %s's already compensated instanced MESH" % (depth * '  ', obj.name))
+                obj.data = data_copies[mesh]
+
+            else:
+                obj.data = data_copies[mesh] = mesh.copy()
 
-            obj.data.transform(Matrix.Rotation(radians(-90), 4, 'X'))
-            obj.data.update()
+                print("INFO: %sadjusting %s's MESH to compensate" % (depth * '  ', obj.name))
+                transform_mesh(obj.data, Matrix.Rotation(radians(-90), 4, 'X'))
 
         def prepare_armature(obj, depth):
             '''
@@ -131,11 +144,18 @@ class PrepareExport(bpy.types.Operator):
             '''
 
             # store the original armature and use a duplicate to be able to deal with instanced objects, and to easily restore it later
-            obj.M3.pre_unity_export_armature = obj.data
-            obj.data = obj.data.copy()
+            armature = obj.data
+            obj.M3.pre_unity_export_armature = armature
 
-            print("INFO: %sadjusting %s's ARMATURE to compensate" % (depth * '  ', obj.name))
-            obj.data.transform(Matrix.Rotation(radians(-90), 4, 'X'))
+            if armature in data_copies:
+                print("INFO: %susing %s's already compensated instanced ARMATURE" % (depth * '  ', obj.name))
+                obj.data = data_copies[armature]
+
+            else:
+                obj.data = data_copies[armature] = armature.copy()
+
+                print("INFO: %sadjusting %s's ARMATURE to compensate" % (depth * '  ', obj.name))
+                obj.data.transform(Matrix.Rotation(radians(-90), 4, 'X'))
 
         def prepare_children(obj, bone_children, depth):
             if obj.children:
@@ -143,7 +163,7 @@ class PrepareExport(bpy.types.Operator):
 
                 for child in obj.children:
                     if child in sel:
-                        self.prepare_for_export(child, sel, matrices, bone_children, triangulate=triangulate, depth=depth, child=True)
+                        self.prepare_for_export(child, sel, matrices, bone_children, data_copies, triangulate=triangulate, depth=depth, child=True)
 
         if obj in sel:
 
@@ -196,15 +216,17 @@ class RestoreExport(bpy.types.Operator):
 
         detriangulate = context.scene.M3.unity_triangulate
 
-        exported = [obj for obj in context.visible_objects if obj.M3.unity_exported]
-        meshes = []
-        armatures = []
+        exported = {obj for obj in context.visible_objects if obj.M3.unity_exported}
+
+        # instanced objects share their compensated data, so collect them in sets to remove each only once
+        meshes = set()
+        armatures = set()
 
         # get root objects
         roots = [obj for obj in exported if not obj.parent]
 
         # get direct bone children, they need special treatment
-        bone_children = [obj for obj in exported if obj.parent and obj.parent.type == 'ARMATURE' and obj.parent_bone]
+        bone_children = {obj for obj in exported if obj.parent and obj.parent.type == 'ARMATURE' and obj.parent_bone}
 
         # restore objects, meshesand modifiers
         for obj in roots:
@@ -257,14 +279,14 @@ class RestoreExport(bpy.types.Operator):
 
         def restore_mesh(obj, depth, meshes):
             print("INFO: %srestoring %s's original pre-export MESH" % (depth * '  ', obj.name))
-            meshes.append(obj.data)
+            meshes.add(obj.data)
 
             obj.data = obj.M3.pre_unity_export_mesh
             obj.M3.pre_unity_export_mesh = None
 
         def restore_armature(obj, depth, armatures):
             print("INFO: %srestoring %s's original pre-export ARMATURE" % (depth * '  ', obj.name))
-            armatures.append(obj.data)
+            armatures.add(obj.data)
 
             obj.data = obj.M3.pre_unity_export_armature
             obj.M3.pre_unity_export_armature = None
@@ -10,6 +10,7 @@ from . utils.tools import get_active_tool
 from . utils.light import adjust_lights_for_rendering, get_area_light_poll
 from . utils.view import sync_light_visibility
 from . utils.material import adjust_bevel_shader
+from . utils.group import update_group_index
 from . items import eevee_preset_items, align_mode_items, render_engine_items, cycles_device_items, driver_limit_items, axis_items, driver_transform_items, driver_space_items, bc_orientation_items, shading_light_items, compositor_items
 
 
@@ -29,6 +30,7 @@ class HistoryUnmirroredCollection(bpy.types.PropertyGroup):
 class HistoryEpochCollection(bpy.types.PropertyGroup):
     name: StringProperty()
     objects: CollectionProperty(type=HistoryObjectsCollection)
+    visible: CollectionProperty(type=HistoryObjectsCollection)
     unmirrored: CollectionProperty(type=HistoryUnmirroredCollection)
 
 
@@ -379,11 +381,8 @@ class M3SceneProperties(bpy.types.PropertyGroup):
     def update_enforce_hide_render(self, context):
         from . ui.operators import shading
 
-        for _, name in shading.render_visibility:
-            obj = bpy.data.objects.get(name)
-
-            if obj:
-                obj.hide_set(obj.visible_get())
+        for obj in shading.get_render_visibility_objects():
+            obj.hide_set(obj.visible_get())
 
     def update_use_bevel_shader(self, context):
         adjust_bevel_shader(context)
@@ -392,6 +391,10 @@ class M3SceneProperties(bpy.types.PropertyGroup):
         if self.use_bevel_shader:
             adjust_bevel_shader(context)
 
+    def update_bevel_shader_nodes(self, context):
+        if self.use_bevel_shader:
+            adjust_bevel_shader(context, nodes_only=True)
+
     eevee_preset: EnumProperty(name="Eevee Preset", description="Eevee Quality Presets", items=eevee_preset_items, default='NONE', update=update_eevee_preset)
     eevee_preset_set_use_scene_lights: BoolProperty(name="Set Use Scene Lights", description="Set Use Scene Lights when changing Eevee Preset", default=False)
     eevee_preset_set_use_scene_world: BoolProperty(name="Set Use Scene World", description="Set Use Scene World when changing Eevee Preset", default=False)
@@ -423,8 +426,8 @@ class M3SceneProperties(bpy.types.PropertyGroup):
 
     use_bevel_shader: BoolProperty(name="Use Bevel Shader", description="Batch Apply Bevel Shader to visible Materials", default=False, update=update_use_bevel_shader)
     bevel_shader_use_dimensions: BoolProperty(name="Consider Object Dimensions for Bevel Radius Modulation", description="Consider Object Dimensions for Bevel Radius Modulation", default=True, update=update_bevel_shader)
-    bevel_shader_samples: IntProperty(name="Samples", description="Bevel Shader Samples", default=16, min=2, max=32, update=update_bevel_shader)
-    bevel_shader_radius: FloatProperty(name="Radius", description="Bevel Shader Global Radius", default=0.015, min=0, precision=3, step=0.01, update=update_bevel_shader)
+    bevel_shader_samples: IntProperty(name="Samples", description="Bevel Shader Samples", default=16, min=2, max=32, update=update_bevel_shader_nodes)
+    bevel_shader_radius: FloatProperty(name="Radius", description="Bevel Shader Global Radius", default=0.015, min=0, precision=3, step=0.01, update=update_bevel_shader_nodes)
 
 
     # VIEWS Pie
@@ -580,14 +583,20 @@ class M3SceneProperties(bpy.types.PropertyGroup):
 
 
 class M3ObjectProperties(bpy.types.PropertyGroup):
+    def update_is_group_empty(self, context):
+        update_group_index(context.scene, self.id_data, 'empties', self.is_group_empty)
+
+    def update_is_group_object(self, context):
+        update_group_index(context.scene, self.id_data, 'objects', self.is_group_object)
+
     unity_exported: BoolProperty(name="Exported to Unity")
 
     pre_unity_export_mx: FloatVectorProperty(name="Pre-Unity-Export Matrix", subtype="MATRIX", size=16, default=flatten_matrix(Matrix()))
     pre_unity_export_mesh: PointerProperty(name="Pre-Unity-Export Mesh", type=bpy.types.Mesh)
     pre_unity_export_armature: PointerProperty(name="Pre-Unity-Export Armature", type=bpy.types.Armature)
 
-    is_group_empty: BoolProperty(name="is group empty", default=False)
-    is_group_object: BoolProperty(name="is group object", default=False)
+    is_group_empty: BoolProperty(name="is group empty", default=False, update=update_is_group_empty)
+    is_group_object: BoolProperty(name="is group object", default=False, update=update_is_group_object)
     group_size: FloatProperty(name="group empty size", default=0.2, min=0)
 
     # toggle smooth tool
@@ -38,6 +38,7 @@ classes = {'CORE': [('properties', [('HistoryObjectsCollection', ''),
                                                       ('Toggle', 'filebrowser_toggle'),
                                                       ('CycleThumbs', 'filebrowser_cycle_thumbnail_size')])],
            'SMART_DRIVE': [('operators.smart_drive', [('SmartDrive', 'smart_drive'),
+                                                      ('BenchmarkDrivers', 'benchmark_drivers'),
                                                       ('SwitchValues', 'switch_driver_values'),
                                                       ('SetValue', 'set_driver_value')])],
            'UNITY': [('operators.unity', [('PrepareExport', 'prepare_unity_export'),
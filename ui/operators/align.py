@@ -2,7 +2,8 @@ import bpy
 from bpy.props import EnumProperty, BoolProperty
 import bmesh
 from mathutils import Vector, Matrix, geometry
-from ... utils.math import get_center_between_verts, create_rotation_difference_matrix, get_loc_matrix, create_selection_bbox, get_right_and_up_axes
+import numpy as np
+from ... utils.math import get_center_between_verts, create_rotation_difference_matrix, get_loc_matrix, create_selection_bbox, get_right_and_up_axes, get_farthest_pair
 from ... items import axis_items, align_type_items, axis_mapping_dict, align_direction_items, align_space_items, align_mode_items
 from ... utils.selection import get_selected_vert_sequences, get_selection_islands
 from ... utils.ui import popup_message
@@ -495,6 +496,10 @@ class Straighten(bpy.types.Operator):
         if not v_start:
             v_start, v_end = self.get_start_and_end_from_distance(verts)
 
+            # all verts are in the same spot, so there is no line to straighten them on
+            if not v_start:
+                return {'CANCELLED'}
+
         # straighten
         self.straighten(bm, verts, v_start, v_end)
 
@@ -504,24 +509,30 @@ class Straighten(bpy.types.Operator):
 
     def straighten(self, bm, verts, v_start, v_end):
         # move all verts but the start and end verts on the vector described by the two
-        verts.remove(v_start)
-        verts.remove(v_end)
+        verts = [v for v in verts if v not in [v_start, v_end]]
 
-        for v in verts:
-            co, _ = geometry.intersect_point_line(v.co, v_start.co, v_end.co)
+        start = np.array(v_start.co)
+        direction = np.array(v_end.co) - start
+
+        # project all verts on the line at once
+        coords = np.array([v.co for v in verts])
+        length_sq = direction @ direction
+
+        factors = (coords - start) @ direction / length_sq if length_sq else np.zeros(len(verts))
+
+        for v, co in zip(verts, start + factors[:, None] * direction):
             v.co = co
 
         bm.normal_update()
 
     def get_start_and_end_from_distance(self, verts):
-        # get vert pairs from selection, using a set of frozensets removes duplicate pairings like [v, v2] and [v2, v], etc
-        pairs = {frozenset([v, v2]) for v in verts for v2 in verts if v2 != v}
-
-        # get distances for each vert pair
-        distances = [((v2.co - v.co).length, (v, v2)) for v, v2 in pairs]
-
         # get the straight's start and end verts based on distance
-        return max(distances, key=lambda x: x[0])[1]
+        pair = get_farthest_pair(np.array([v.co for v in verts]))
+
+        if pair:
+            i, j = pair
+            return verts[i], verts[j]
+        return None, None
 
     def get_start_and_end_from_history(self, bm):
         history = list(bm.select_history)
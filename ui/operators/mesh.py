@@ -2,9 +2,10 @@ import bpy
 from bpy.props import IntProperty, BoolProperty, EnumProperty
 import bmesh
 from math import radians
+import numpy as np
 from ... utils.registration import get_addon
 from ... utils.system import printd
-from ... utils.bmesh import ensure_custom_data_layers
+from ... utils.mesh import get_edge_face_angles, get_vgroup_edge_mask, clear_edge_data
 from ... items import shade_mode_items
 
 
@@ -163,29 +164,21 @@ class Shade(bpy.types.Operator):
 
             # set sharps based on face angles + activate auto smooth + enable sharp overlays
             if self.mode == 'SMOOTH' and self.sharpen:
-                for obj, _, _ in selected:
-                    if obj.type == 'MESH':
-                        self.set_sharps(context.mode, obj, hypercursor)
+                objects = [obj for obj, _, _ in selected + list(more_objects) if obj.type == 'MESH']
 
-                for obj, _, _ in more_objects:
-                    if obj.type == 'MESH':
-                        self.set_sharps(context.mode, obj, hypercursor)
+                self.set_obj_sharps(objects, hypercursor)
 
                 context.space_data.overlay.show_edge_sharp = True
 
             elif self.mode == 'FLAT' and self.clear:
-                for obj, _, _ in selected:
-                    if obj.type == 'MESH':
-                        self.clear_obj_sharps(obj)
+                objects = [obj for obj, _, _ in selected + list(more_objects) if obj.type == 'MESH']
 
-                for obj, _, _ in more_objects:
-                    if obj.type == 'MESH':
-                        self.clear_obj_sharps(obj)
+                self.clear_obj_sharps(objects)
 
         elif context.mode == "EDIT_MESH":
             if self.mode == 'SMOOTH':
-                if self.set_sharps:
-                    self.set_sharps(context.mode, context.active_object, hypercursor)
+                if self.sharpen:
+                    self.set_mesh_sharps(context.active_object, hypercursor)
 
                     context.space_data.overlay.show_edge_sharp = True
                 else:
@@ -193,35 +186,59 @@ class Shade(bpy.types.Operator):
 
             elif self.mode == 'FLAT':
                 if self.clear:
-                    self.clear_mesh_sharps(context.active_object.data)
+                    self.clear_mesh_sharps(context)
                 else:
                     bpy.ops.mesh.faces_shade_flat()
 
         return {'FINISHED'}
 
-    def set_sharps(self, mode, obj, hypercursor):
+    def set_obj_sharps(self, objects, hypercursor):
+        '''
+        sharpen edges of all objects at once, based on the face angles computed from the polygon normals
+        objects sharing the same mesh are only processed once
+        '''
+
+        meshes = {}
+
+        for obj in objects:
+            if obj.data not in meshes:
+                meshes[obj.data] = obj
+
+        for mesh, obj in meshes.items():
+            mesh.use_auto_smooth = True
+
+            sharpen = get_edge_face_angles(mesh) > mesh.auto_smooth_angle
+
+            if hypercursor and self.avoid_sharpen_edge_bevels:
+                vgindices = [vg.index for vg in obj.vertex_groups if 'Edge Bevel' in vg.name]
+
+                if vgindices:
+                    sharpen &= ~get_vgroup_edge_mask(mesh, vgindices)
+
+            # keep existing sharps
+            sharps = np.empty(len(mesh.edges), bool)
+            mesh.edges.foreach_get('use_edge_sharp', sharps)
+
+            mesh.edges.foreach_set('use_edge_sharp', sharps | sharpen)
+            mesh.update()
+
+    def set_mesh_sharps(self, obj, hypercursor):
         obj.data.use_auto_smooth = True
         angle = obj.data.auto_smooth_angle
 
-        if mode == 'OBJECT':
-            bm = bmesh.new()
-            bm.from_mesh(obj.data)
-            vglayer = bm.verts.layers.deform.verify()
-
-        elif mode == 'EDIT_MESH':
-            bm = bmesh.from_edit_mesh(obj.data)
-            vglayer = bm.verts.layers.deform.verify()
+        bm = bmesh.from_edit_mesh(obj.data)
+        vglayer = bm.verts.layers.deform.verify()
 
-            # smooth all faces like in object mode
-            for f in bm.faces:
-                f.smooth = True
+        # smooth all faces like in object mode
+        for f in bm.faces:
+            f.smooth = True
 
         bm.normal_update()
 
         if hypercursor and self.avoid_sharpen_edge_bevels:
             edge_bevelled_edges = self.get_edge_bevelled_edges(obj, bm, vglayer)
         else:
-            edge_bevelled_edges = []
+            edge_bevelled_edges = set()
 
         # get the edges to be sharpened
         sharpen = [e for e in bm.edges if e.index not in edge_bevelled_edges and len(e.link_faces) == 2 and e.calc_face_angle() > angle]
@@ -229,12 +246,7 @@ class Shade(bpy.types.Operator):
         for e in sharpen:
             e.smooth = False
 
-        if mode == 'OBJECT':
-            bm.to_mesh(obj.data)
-            bm.free()
-
-        elif mode == 'EDIT_MESH':
-            bmesh.update_edit_mesh(obj.data)
+        bmesh.update_edit_mesh(obj.data)
 
     def get_edge_bevelled_edges(self, obj, bm, vglayer, debug=False):
         '''
@@ -243,7 +255,7 @@ class Shade(bpy.types.Operator):
         
         # get all Edge Bevel vgroups as a dict of dicts {index: {'name': 'Name', 'verts': [], 'edges': []}}
         vgroups = {vg.index: {'name': vg.name,
-                              'verts': [],
+                              'verts': set(),
                               'edges': []} for vg in obj.vertex_groups if 'Edge Bevel' in vg.name}
 
         verts = [v for v in bm.verts]
@@ -254,17 +266,17 @@ class Shade(bpy.types.Operator):
 
             for vgindex, weight in v[vglayer].items():
                 if vgindex in vgroups and weight == 1:
-                    vgroups[vgindex]['verts'].append(v.index)
+                    vgroups[vgindex]['verts'].add(v.index)
 
-        # create list of all the edges that are used for edge bevels
-        edge_bevelled_edges = []
+        # create set of all the edges that are used for edge bevels
+        edge_bevelled_edges = set()
 
         for e in bm.edges:
             # print(e.index, [v.index for v in e.verts])
 
             for vgindex, vgdata in vgroups.items():
                 if all(v.index in vgdata['verts'] for v in e.verts):
-                    edge_bevelled_edges.append(e.index)
+                    edge_bevelled_edges.add(e.index)
 
                     # and just for debug purposes, update the dict as well
                     vgdata['edges'].append(e.index)
@@ -275,57 +287,36 @@ class Shade(bpy.types.Operator):
 
         return edge_bevelled_edges
 
-    def clear_obj_sharps(self, obj):
-        obj.data.use_auto_smooth = False
-
-        bm = bmesh.new()
-        bm.from_mesh(obj.data)
-        bm.normal_update()
-
-        _, bw, cr = ensure_custom_data_layers(bm)
-
-        for e in bm.edges:
-            if self.clear_sharps:
-                e.smooth = True
-
-            if self.clear_bweights:
-                e[bw] = 0
-
-            if self.clear_creases:
-                e[cr] = 0
-
-            if self.clear_seams:
-                e.seam = False
-
-        bm.to_mesh(obj.data)
-        bm.clear()
+    def clear_obj_sharps(self, objects):
+        '''
+        clear the edge data of all objects at once, objects sharing the same mesh are only processed once
+        '''
 
-    def clear_mesh_sharps(self, mesh):
-        mesh.use_auto_smooth = False
+        for mesh in {obj.data for obj in objects}:
+            mesh.use_auto_smooth = False
 
-        bm = bmesh.from_edit_mesh(mesh)
-        bm.normal_update()
+            clear_edge_data(mesh, sharps=self.clear_sharps, bweights=self.clear_bweights, creases=self.clear_creases, seams=self.clear_seams)
+            mesh.update()
 
-        _, bw, cr = ensure_custom_data_layers(bm)
+    def clear_mesh_sharps(self, context):
+        '''
+        clear the edge data of all meshes in edit mode, the bulk writes require object mode, so toggle out of edit mode and back once
+        '''
 
-        # flatten all faces like in object mode
-        for f in bm.faces:
-            f.smooth = False
+        objects = [obj for obj in context.objects_in_mode if obj.type == 'MESH']
 
-        for e in bm.edges:
-            if self.clear_sharps:
-                e.smooth = True
+        bpy.ops.object.mode_set(mode='OBJECT')
 
-            if self.clear_bweights:
-                e[bw] = 0
+        for mesh in {obj.data for obj in objects}:
+            mesh.use_auto_smooth = False
 
-            if self.clear_creases:
-                e[cr] = 0
+            # flatten all faces like in object mode
+            mesh.polygons.foreach_set('use_smooth', np.zeros(len(mesh.polygons), bool))
 
-            if self.clear_seams:
-                e.seam = False
+            clear_edge_data(mesh, sharps=self.clear_sharps, bweights=self.clear_bweights, creases=self.clear_creases, seams=self.clear_seams)
+            mesh.update()
 
-        bmesh.update_edit_mesh(mesh)
+        bpy.ops.object.mode_set(mode='EDIT')
 
 
 class ToggleAutoSmooth(bpy.types.Operator):
@@ -1,11 +1,11 @@
 import bpy
 from bpy.props import BoolProperty
-from mathutils import Matrix
+from mathutils import Matrix, Vector
 import bmesh
 from ... utils.math import get_loc_matrix, get_rot_matrix, get_sca_matrix, create_rotation_matrix_from_vertex, create_rotation_matrix_from_edge, get_center_between_verts, create_rotation_matrix_from_face
 from ... utils.math import average_locations
 from ... utils.ui import popup_message
-from ... utils.object import set_obj_origin, get_eval_bbox
+from ... utils.object import set_obj_origin, set_obj_origins, get_object_snapshot
 from ... utils.mesh import get_bbox
 from ... utils.draw import draw_point 
 from ... utils.registration import get_addon
@@ -273,38 +273,46 @@ class OriginToBottomBounds(bpy.types.Operator):
 
         sel = [obj for obj in context.selected_objects if obj.type == 'MESH']
 
-        for obj in sel:
+        # get the local bounding box bottom centers of all objects at once, either of the evaluated meshes or the original ones
+        if self.evaluated:
             if debug:
-                print(obj.name)
+                print(" getting evaluated bottom centers")
 
-            mx = obj.matrix_world
-            _, rot, sca = mx.decompose()
+            _, bboxes = get_object_snapshot(sel)
+            bottom_centers = bboxes[:, [0, 3, 4, 7]].mean(axis=1)
 
-            # get bounding box bottom center, either of the evaluated mesh or the original one
-            if self.evaluated:
-                if debug:
-                    print(" getting evaluated bottom center")
+        else:
+            if debug:
+                print(" getting orignial bottom centers")
 
-                dg = context.evaluated_depsgraph_get()
-                bbox = get_eval_bbox(obj)
-                bottom_center = mx @ average_locations([bbox[0], bbox[3], bbox[4], bbox[7]])
+            # meshes shared by multiple objects only need their bbox calculated once
+            mesh_centers = {}
 
-            else:
-                if debug:
-                    print(" getting orignial bottom center")
+            for obj in sel:
+                if obj.data not in mesh_centers:
+                    _, centers, _ = get_bbox(obj.data)
+                    mesh_centers[obj.data] = centers[4]
+
+            bottom_centers = [mesh_centers[obj.data] for obj in sel]
 
-                _, centers, _ = get_bbox(obj.data)
-                bottom_center = mx @ centers[4]
+        origins = {}
+
+        for obj, center in zip(sel, bottom_centers):
+            mx = obj.matrix_world
+            _, rot, sca = mx.decompose()
+
+            bottom_center = mx @ Vector(center)
 
             if debug:
+                print(obj.name)
                 print("bottom center:", bottom_center)
                 draw_point(bottom_center, mx=mx, color=yellow, modal=False)
                 context.area.tag_redraw()
 
             # build new origin matrix
-            omx = Matrix.LocRotScale(bottom_center, rot, sca)
+            origins[obj] = Matrix.LocRotScale(bottom_center, rot, sca)
+
+        # and set the origins, all in one go
+        set_obj_origins(origins, decalmachine=decalmachine, meshmachine=meshmachine)
 
-            # and set the origin
-            set_obj_origin(obj, omx, bm=None, decalmachine=decalmachine, meshmachine=meshmachine)
-        
         return {'FINISHED'}
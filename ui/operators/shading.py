@@ -2,6 +2,7 @@ import bpy
 from bpy.props import IntProperty, StringProperty
 from math import degrees, radians
 from mathutils import Matrix
+import numpy as np
 from ... utils.registration import get_prefs
 from ... utils.light import adjust_lights_for_rendering, get_area_light_poll
 from ... utils.view import sync_light_visibility
@@ -11,6 +12,46 @@ from ... utils.material import adjust_bevel_shader
 render_visibility = []
 
 
+def get_render_hidden_objects(scene):
+    '''
+    get the scene's objects with hide_render enabled
+    the prop is read for all of them in a single foreach_get pass, and the objects are then picked in a single pass as well
+    NOTE: scene.objects can't be indexed directly, every int lookup walks the collection from the start
+    '''
+
+    objects = scene.objects
+    count = len(objects)
+
+    hide_render = np.empty(count, dtype=bool)
+    objects.foreach_get('hide_render', hide_render)
+
+    if not hide_render.any():
+        return []
+
+    return [obj for obj, hidden in zip(objects, hide_render) if hidden]
+
+
+def get_render_visibility_objects():
+    '''
+    get the objects hidden by SwitchShading.enforce_render_visibility()
+    they are looked up by name, as references to them may no longer be valid after undo, but all names are resolved via a single name map
+    '''
+
+    objects = dict(bpy.data.objects.items())
+    found = []
+
+    for _, name in render_visibility:
+        obj = objects.get(name)
+
+        if obj:
+            found.append(obj)
+
+        else:
+            print(f"WARNING: Object {name} could no longer be found")
+
+    return found
+
+
 class SwitchShading(bpy.types.Operator):
     bl_idname = "machin3.switch_shading"
     bl_label = "MACHIN3: Switch Shading"
@@ -137,21 +178,16 @@ class SwitchShading(bpy.types.Operator):
 
         # hide objects that shouldn't render
         if new_shading_type == 'RENDERED':
-            render_visibility = [(obj, obj.name) for obj in context.visible_objects if obj.hide_render == True and obj.visible_get()]
+            render_visibility = [(obj, obj.name) for obj in get_render_hidden_objects(context.scene) if obj.visible_get(viewport=context.space_data)]
 
             for obj, name in render_visibility:
                 # print("hiding:", name)
                 obj.hide_set(True)
         else:
 
-            for obj, name in render_visibility:
-                obj = bpy.data.objects.get(name)
-
-                if obj:
-                    # print("unhiding:", name)
-                    obj.hide_set(False)
-                else:
-                    print(f"WARNING: Object {name} could no longer be found")
+            for obj in get_render_visibility_objects():
+                # print("unhiding:", obj.name)
+                obj.hide_set(False)
 
             render_visibility = []
 
@@ -144,9 +144,10 @@ class PanelMACHIN3tools(bpy.types.Panel):
         r = row.row(align=True)
         r.prop(m3, 'driven_limit', expand=True)
 
-        r = column.row()
+        r = column.row(align=True)
         r.scale_y = 1.2
         r.operator("machin3.smart_drive", text='Drive it!', icon='AUTO')
+        r.operator("machin3.benchmark_drivers", text='', icon='TIME')
 
     def draw_unity(self, context, m3, layout):
         all_prepared = True if context.selected_objects and all([obj.M3.unity_exported for obj in context.selected_objects]) else False
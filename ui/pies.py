@@ -4,7 +4,7 @@ import os
 import importlib
 from .. utils.registration import get_prefs, get_addon
 from .. utils.ui import get_icon
-from .. utils.collection import get_scene_collections
+from .. utils.collection import get_scene_collections, get_collection_index
 from .. utils.system import abspath, get_temp_dir
 from .. utils.tools import get_tools_from_context, get_active_tool
 from .. utils.light import get_area_light_poll
@@ -2597,7 +2597,7 @@ class PieCollections(Menu):
                 collections = get_scene_collections(context.scene)[:10]
 
             if decalmachine:
-                decalparentcollections = [col for col in get_scene_collections(context.scene, ignore_decals=False) if col.DM.isdecalparentcol][:10]
+                decalparentcollections = get_collection_index(context.scene)['decalparents'][:10]
 
 
         if decalmachine:
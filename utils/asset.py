@@ -46,6 +46,30 @@ def get_asset_ids(context):
 
 # CATALOGS
 
+# the parsed catalog lines of each cat file, keyed by path and stored with the file's mtime, so unchanged files aren't read again
+catalog_files = {}
+
+
+def get_catalog_lines(cat_path):
+    '''
+    read and parse a blender_assets.cats.txt file, or return the cached result if the file hasn't been modified since
+    '''
+
+    mtime = os.path.getmtime(cat_path)
+    cached = catalog_files.get(cat_path)
+
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(cat_path) as f:
+        lines = f.readlines()
+
+    catalog_lines = [line[:-1].split(':') for line in lines if line != '\n' and not any([line.startswith(skip) for skip in ['#', 'VERSION']]) and len(line.split(':')) == 3]
+
+    catalog_files[cat_path] = (mtime, catalog_lines)
+    return catalog_lines
+
+
 def get_catalogs_from_asset_libraries(context, debug=False):
     '''
     scan cat files of all asset libraries and get the uuid for each catalog
@@ -65,12 +89,8 @@ def get_catalogs_from_asset_libraries(context, debug=False):
             if debug:
                 print(libname, cat_path)
 
-            with open(cat_path) as f:
-                lines = f.readlines()
-
-            for line in lines:
-                if line != '\n' and not any([line.startswith(skip) for skip in ['#', 'VERSION']]) and len(line.split(':')) == 3:
-                    all_catalogs.append(line[:-1].split(':') + [libname, libpath])
+            for catalog_line in get_catalog_lines(cat_path):
+                all_catalogs.append(catalog_line + [libname, libpath])
 
     catalogs = {}
 
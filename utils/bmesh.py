@@ -1,4 +1,9 @@
 import bpy
+from mathutils.kdtree import KDTree
+
+
+# the non-manifold verts of edit meshes, and a KD tree of their locations, cached per mesh
+boundary_indices = {}
 
 
 # GENERAL CUSTOM DATA LAYERS
@@ -57,3 +62,163 @@ def get_tri_coords_from_face(loop_triangles, f, mx=None):
         return [mx @ l.vert.co for lt in loop_triangles if lt[0].face == f for l in lt]
     else:
         return [l.vert.co for lt in loop_triangles if lt[0].face == f for l in lt]
+
+
+# BOUNDARY INDEX
+
+def is_boundary_vert(v):
+    return any(not e.is_manifold for e in v.link_edges)
+
+
+def build_boundary_index(bm):
+    bm.verts.index_update()
+
+    verts = [v for v in bm.verts if is_boundary_vert(v)]
+
+    tree = KDTree(len(verts))
+
+    for i, v in enumerate(verts):
+        tree.insert(v.co, i)
+
+    tree.balance()
+
+    return {'counts': (len(bm.verts), len(bm.edges), len(bm.faces)),
+            'tree': tree,
+            'verts': verts,
+            'lookup': {v.index: i for i, v in enumerate(verts)},
+            'removed': set(),
+            'added': set(),
+            'pending': False}
+
+
+def rekey_boundary_index(bm, index):
+    '''
+    re-key the lookup of a cached boundary index by the current vert indices, and drop the added verts, that have been removed since
+    '''
+
+    bm.verts.index_update()
+
+    index['lookup'] = {v.index: i for i, v in enumerate(index['verts']) if i not in index['removed'] and v.is_valid}
+    index['added'] = {v for v in index['added'] if v.is_valid}
+
+
+def get_lookup_index(index, v):
+    '''
+    get the tree index of a vert in the boundary index, or None if it isn't in the tree
+    NOTE: the lookup is keyed by vert index, and the cached vert is checked for validity, before it's compared to the passed in one
+    '''
+
+    i = index['lookup'].get(v.index)
+
+    if i is not None:
+        cached = index['verts'][i]
+
+        if cached.is_valid and cached == v:
+            return i
+
+
+def get_boundary_index(mesh, bm):
+    '''
+    get the non-manifold verts of an edit mesh and a KD tree of their locations, cached per mesh
+    the cache entry of a mesh is invalidated, when its geometry changes, see invalidate_boundary_indices(), except for changes announced by update_boundary_index()
+    '''
+
+    key = mesh.as_pointer()
+    index = boundary_indices.get(key)
+
+    if index and index['counts'] == (len(bm.verts), len(bm.edges), len(bm.faces)):
+        rekey_boundary_index(bm, index)
+        return index
+
+    index = boundary_indices[key] = build_boundary_index(bm)
+    return index
+
+
+def find_boundary_vert(bm, index, co, exclude=()):
+    '''
+    find the closest non-manifold vert in the boundary index, skipping the excluded verts
+    return the vert and its distance, or None and None, if there is no such vert
+    '''
+
+    skip = index['removed'] | {i for i in [get_lookup_index(index, v) for v in exclude] if i is not None}
+
+    closest, distance = None, None
+
+    if len(skip) < len(index['verts']):
+        location, i, distance = index['tree'].find(co, filter=lambda i: i not in skip)
+
+        if i is not None:
+            closest = index['verts'][i]
+
+            # the vert has been removed or moved behind the index's back, so the index can't be trusted anymore, rebuild it and try again
+            if not closest.is_valid or closest.co != location:
+                index.update(build_boundary_index(bm))
+                return find_boundary_vert(bm, index, co, exclude=exclude)
+
+    # the few verts added since the tree was built are checked linearly
+    for v in index['added']:
+        if v.is_valid and v not in exclude:
+            d = (v.co - co).length
+
+            if distance is None or d < distance:
+                closest, distance = v, d
+
+    return closest, distance
+
+
+def update_boundary_index(mesh, bm, index, verts, removed=()):
+    '''
+    incrementally update the boundary index after a local change of the mesh, like a single face fill
+    the passed in verts are those whose boundary status may have changed, the removed verts have to be passed in before they are actually removed from the bmesh
+    '''
+
+    for v in removed:
+        i = get_lookup_index(index, v)
+
+        if i is not None:
+            index['removed'].add(index['lookup'].pop(v.index))
+
+        index['added'].discard(v)
+
+    for v in verts:
+        if v.is_valid:
+            i = get_lookup_index(index, v)
+
+            if is_boundary_vert(v):
+                if i is None:
+                    index['added'].add(v)
+
+            elif i is not None:
+                index['removed'].add(index['lookup'].pop(v.index))
+
+            else:
+                index['added'].discard(v)
+
+    index['counts'] = (len(bm.verts), len(bm.edges), len(bm.faces))
+
+    # the geometry update caused by this change is known already, so the index can survive it
+    index['pending'] = True
+
+    # rebuild the tree from scratch eventually, once the linearly checked verts pile up
+    if len(index['added']) > 64:
+        boundary_indices.pop(mesh.as_pointer(), None)
+
+
+def invalidate_boundary_indices(meshes=None):
+    '''
+    invalidate the boundary indices of the passed in meshes, or of all meshes if None are passed in
+    '''
+
+    if meshes is None:
+        boundary_indices.clear()
+
+    else:
+        for mesh in meshes:
+            key = mesh.as_pointer()
+            index = boundary_indices.get(key)
+
+            if index and index['pending']:
+                index['pending'] = False
+
+            else:
+                boundary_indices.pop(key, None)
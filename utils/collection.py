@@ -1,7 +1,11 @@
 import bpy
+from collections import deque
 from . registration import get_addon
 
 
+collection_index = {}
+
+
 def get_groups_collection(scene):
     mcol = scene.collection
 
@@ -20,29 +24,64 @@ def get_groups_collection(scene):
     return gpcol
 
 
-def get_scene_collections(scene, ignore_decals=True):
-    decalmachine, _, _, _ = get_addon("DECALmachine")
+def get_collection_index(scene):
+    '''
+    get the scene's collection hierarchy index, which is only rebuilt when collections change
+    the index holds the scene collections in breadth first order, the max depth, as well as DECALmachine's decal type and decal parent collections
+    '''
+
     mcol = scene.collection
 
-    scenecols = []
-    seen = list(mcol.children)
+    # NOTE: the names of all collections catch added, removed and renamed collections, which don't necessarily cause a depsgraph collection update
+    # ####: moving collections in the hierarchy does, and is handled by invalidating the index in the depsgraph handler
+    key = tuple(bpy.data.collections.keys())
+
+    index = collection_index.get(scene.name)
+
+    if index and index['key'] == key:
+        return index
+
+    decalmachine, _, _, _ = get_addon("DECALmachine")
+
+    collections = []
+    depths = {}
+    queue = deque((col, 1) for col in mcol.children)
 
-    while seen:
-        col = seen.pop(0)
-        if col not in scenecols:
-            if not (ignore_decals and decalmachine and (col.DM.isdecaltypecol or col.DM.isdecalparentcol)):
-                scenecols.append(col)
-        seen.extend(list(col.children))
+    while queue:
+        col, depth = queue.popleft()
 
-    return scenecols
+        if col not in depths:
+            collections.append(col)
+
+        # collections linked in multiple places only need to be traversed again, if they are found deeper in the hierarchy
+        elif depth <= depths[col]:
+            continue
+
+        depths[col] = depth
+        queue.extend((child, depth + 1) for child in col.children)
+
+    index = {'key': key,
+             'collections': collections,
+             'max_depth': max(depths.values(), default=0),
+             'decals': {col for col in collections if col.DM.isdecaltypecol or col.DM.isdecalparentcol} if decalmachine else set(),
+             'decalparents': [col for col in collections if col.DM.isdecalparentcol] if decalmachine else []}
+
+    collection_index[scene.name] = index
+    return index
+
+
+def invalidate_collection_index():
+    collection_index.clear()
+
+
+def get_scene_collections(scene, ignore_decals=True):
+    index = get_collection_index(scene)
 
+    if ignore_decals and index['decals']:
+        return [col for col in index['collections'] if col not in index['decals']]
 
-def get_collection_depth(self, collections, depth=0, init=False):
-    if init or depth > self.depth:
-        self.depth = depth
+    return list(index['collections'])
 
-    for col in collections:
-        if col.children:
-            get_collection_depth(self, col.children, depth + 1, init=False)
 
-    return self.depth
+def get_collection_depth(scene):
+    return get_collection_index(scene)['max_depth']
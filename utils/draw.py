@@ -391,6 +391,36 @@ def draw_mesh_wire(batch, color=(1, 1, 1), width=1, alpha=1, xray=True, modal=Tr
         bpy.types.SpaceView3D.draw_handler_add(draw, (), 'WINDOW', 'POST_VIEW')
 
 
+def get_mesh_wire_batch(coords, indices):
+    '''
+    create a reusable gpu batch from local space coords and edge indices, to be drawn via draw_mesh_wire_instances()
+    '''
+
+    shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+    return batch_for_shader(shader, 'LINES', {"pos": coords}, indices=indices)
+
+
+def draw_mesh_wire_instances(batch, matrices, color=(1, 1, 1), width=1, alpha=1, xray=True):
+    '''
+    takes a gpu batch created by get_mesh_wire_batch() and draws it once for each of the passed in matrices
+    so the geometry is only uploaded once, no matter how many instances are drawn
+    '''
+
+    gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
+    gpu.state.blend_set('ALPHA')
+
+    shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+    shader.uniform_float("color", (*color, alpha))
+    shader.uniform_float("lineWidth", width)
+    shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
+    shader.bind()
+
+    for mx in matrices:
+        with gpu.matrix.push_pop():
+            gpu.matrix.multiply_matrix(mx)
+            batch.draw(shader)
+
+
 def draw_bbox(bbox, mx=Matrix(), color=(1, 1, 1), corners=0, width=1, alpha=1, xray=True, modal=True):
     '''
     draw bbox conrners, useful to highlight objects without drawing the wire
@@ -1,10 +1,21 @@
 import bpy
+import re
 from mathutils import Vector, Quaternion
-from . object import parent, unparent
+from . object import parent_objects, unparent
 from . math import average_locations, get_loc_matrix, get_rot_matrix
 from . import registration as r
 
 
+# the group empties and group objects of each scene, see get_group_index()
+group_indices = {}
+
+# the used numbers, the objects using them and the lowest free number of each group name sequence, see get_unique_group_name()
+group_name_allocators = {}
+
+# the object count of the blend file, to detect removed objects, see check_group_name_allocators()
+object_count = 0
+
+
 # CREATION / DESTRUCTION
 
 def group(context, sel, location='AVERAGE', rotation='WORLD'):
@@ -25,8 +36,10 @@ def group(context, sel, location='AVERAGE', rotation='WORLD'):
 
     empty.M3.group_size = r.get_prefs().group_size
 
+    # all objects share the same parent inverse matrix, so it's only calculated once
+    parent_objects(sel, empty)
+
     for obj in sel:
-        parent(obj, empty)
         obj.M3.is_group_object = True
 
     return empty
@@ -37,16 +50,37 @@ def ungroup(empty):
         unparent(obj)
         obj.M3.is_group_object = False
 
+    remove_from_group_index(empty)
     bpy.data.objects.remove(empty, do_unlink=True)
 
 
 def clean_up_groups(context):
-    for obj in context.scene.objects:
+    '''
+    only the dirty objects of the group index are checked, see mark_group_dirty(), rather than all objects in the scene
+    '''
+
+    index = get_group_index(context.scene)
+    dirty = index['dirty']
+
+    remove_empty = r.get_prefs().group_remove_empty
+
+    # NOTE: changing the group props below marks the objects dirty again, so keep going until nothing is left
+    while dirty:
+        obj = dirty.pop()
+
+        if not is_valid(obj):
+            continue
 
         # remove empty groups
         if obj.M3.is_group_empty and not obj.children:
-            if r.get_prefs().group_remove_empty:
+            if remove_empty:
                 print("INFO: Removing empty Group", obj.name)
+
+                # the parent group may be empty now as well
+                if obj.parent:
+                    dirty.add(obj.parent)
+
+                remove_from_group_index(obj)
                 bpy.data.objects.remove(obj, do_unlink=True)
 
         elif obj.M3.is_group_object:
@@ -62,27 +96,188 @@ def clean_up_groups(context):
                 obj.M3.is_group_object = False
                 print(f"INFO: {obj.name} is no longer a group object, because it doesn't have any parent")
 
-        elif not obj.M3.is_group_object and obj.parent and obj.parent.M3.is_group_empty:
+        elif obj.parent and obj.parent.M3.is_group_empty:
             obj.M3.is_group_object = True
             print(f"INFO: {obj.name} is now a group object, because it was manually parented to {obj.parent.name}")
 
 
+# INDEX
+
+def get_group_index(scene):
+    '''
+    get the group empties and group objects of a scene, cached per scene
+    the index is kept up to date, when the is_group_empty and is_group_object props change, see update_group_index(), and from the depsgraph, see update_group_index_from_depsgraph()
+    it also collects the dirty objects, whose hierarchies need to be cleaned up and faded again, see mark_group_dirty()
+    '''
+
+    index = group_indices.get(scene.name)
+
+    if index is None:
+        index = group_indices[scene.name] = {'empties': set(),
+                                             'objects': set(),
+                                             'dirty': set(),
+                                             'fade_dirty': set(),
+                                             'fade_factor': None,
+                                             'visible_empty': None}
+
+        for obj in scene.objects:
+            if obj.M3.is_group_empty:
+                index['empties'].add(obj)
+
+            if obj.M3.is_group_object:
+                index['objects'].add(obj)
+
+        # nothing has been cleaned up yet, so everything is dirty initially
+        index['dirty'].update(index['empties'] | index['objects'])
+
+    return index
+
+
+def mark_group_dirty(index, obj):
+    '''
+    mark an object and its parent for clean up and fading
+    '''
+
+    for o in [obj, obj.parent] if obj.parent else [obj]:
+        index['dirty'].add(o)
+        index['fade_dirty'].add(o)
+
+
+def update_group_index(scene, obj, key, state):
+    '''
+    add the object to or remove it from the empties or objects of an already built group index, and mark it dirty
+    '''
+
+    if state:
+        if scene and scene.name in group_indices:
+            group_indices[scene.name][key].add(obj)
+
+    else:
+        for index in group_indices.values():
+            index[key].discard(obj)
+
+    if scene and scene.name in group_indices:
+        mark_group_dirty(group_indices[scene.name], obj)
+
+
+def update_group_index_from_depsgraph(scene, depsgraph):
+    '''
+    pick up objects, whose group props haven't been set via their update callbacks, like duplicated groups, and objects parented to group empties manually
+    objects removed from the blend file are pruned, when collections change
+    '''
+
+    index = group_indices.get(scene.name)
+
+    if index is None:
+        return
+
+    if depsgraph.id_type_updated('COLLECTION'):
+        prune_group_index(index)
+
+    for update in depsgraph.updates:
+        if update.is_updated_transform:
+            obj = update.id.original
+
+            if isinstance(obj, bpy.types.Object):
+                if obj.M3.is_group_empty:
+                    index['empties'].add(obj)
+
+                if obj.M3.is_group_object:
+                    index['objects'].add(obj)
+
+                if obj.M3.is_group_empty or obj.M3.is_group_object or (obj.parent and obj.parent.M3.is_group_empty):
+                    mark_group_dirty(index, obj)
+
+
+def is_valid(obj):
+    '''
+    check if the object has been removed from the blend file
+    '''
+
+    try:
+        obj.name
+        return True
+
+    except ReferenceError:
+        return False
+
+
+def prune_group_index(index):
+    '''
+    drop removed objects from the index
+    the removed objects' parents can no longer be looked up, so all group empties left without children are marked dirty instead, to have them cleaned up too
+    '''
+
+    for key in ['empties', 'objects', 'dirty', 'fade_dirty']:
+        index[key].difference_update([obj for obj in index[key] if not is_valid(obj)])
+
+    for empty in index['empties']:
+        if not empty.children:
+            mark_group_dirty(index, empty)
+
+    if index['visible_empty'] not in index['empties']:
+        index['visible_empty'] = None
+
+
+def remove_from_group_index(obj):
+    '''
+    remove an object from all group indices, before it's removed from the blend file
+    '''
+
+    for index in group_indices.values():
+        for key in ['empties', 'objects', 'dirty', 'fade_dirty']:
+            index[key].discard(obj)
+
+        if index['visible_empty'] == obj:
+            index['visible_empty'] = None
+
+
+def invalidate_group_index():
+    group_indices.clear()
+
+
 # CONTEXT
 
 def get_group_polls(context):
-    active_group = context.active_object if context.active_object and context.active_object.M3.is_group_empty and context.active_object.select_get() else None
-    active_child = context.active_object if context.active_object and context.active_object.parent and context.active_object.M3.is_group_object and context.active_object.select_get() else None
+    '''
+    the visible group empties are looked up via the group index, starting with the one found visible last time, everything else only depends on the selection
+    '''
 
-    group_empties = bool([obj for obj in context.visible_objects if obj.M3.is_group_empty])
-    groupable = bool([obj for obj in context.selected_objects if (obj.parent and obj.parent.M3.is_group_empty) or not obj.parent])
-    ungroupable = bool([obj for obj in context.selected_objects if obj.M3.is_group_empty]) if group_empties else False
+    active = context.active_object
+    sel = context.selected_objects
 
-    addable = bool([obj for obj in context.selected_objects if obj != (active_group if active_group else active_child.parent) and obj not in (active_group.children if active_group else active_child.parent.children) and (not obj.parent or (obj.parent and obj.parent.M3.is_group_empty and not obj.parent.select_get()))]) if active_group or active_child else False
+    active_group = active if active and active.M3.is_group_empty and active.select_get() else None
+    active_child = active if active and active.parent and active.M3.is_group_object and active.select_get() else None
 
-    removable = bool([obj for obj in context.selected_objects if obj.M3.is_group_object])
-    selectable = bool([obj for obj in context.selected_objects if obj.M3.is_group_empty or obj.M3.is_group_object])
-    duplicatable = bool([obj for obj in context.selected_objects if obj.M3.is_group_empty])
-    groupifyable = bool([obj for obj in context.selected_objects if obj.type == 'EMPTY' and not obj.M3.is_group_empty and obj.children])
+    view = context.space_data if context.space_data and context.space_data.type == 'VIEW_3D' else None
+    index = get_group_index(context.scene)
+
+    visible_empty = index['visible_empty']
+
+    # NOTE: removed objects are only pruned on the next depsgraph update, so the cached references may be invalid when drawing before it
+    if visible_empty in index['empties'] and is_valid(visible_empty) and visible_empty.visible_get(view_layer=context.view_layer, viewport=view):
+        group_empties = True
+
+    else:
+        index['visible_empty'] = next((obj for obj in index['empties'] if is_valid(obj) and obj.visible_get(view_layer=context.view_layer, viewport=view)), None)
+        group_empties = bool(index['visible_empty'])
+
+    groupable = any((obj.parent and obj.parent.M3.is_group_empty) or not obj.parent for obj in sel)
+    ungroupable = any(obj.M3.is_group_empty for obj in sel) if group_empties else False
+
+    if active_group or active_child:
+        group_empty = active_group if active_group else active_child.parent
+        children = set(group_empty.children)
+
+        addable = any(obj != group_empty and obj not in children and (not obj.parent or (obj.parent.M3.is_group_empty and not obj.parent.select_get())) for obj in sel)
+
+    else:
+        addable = False
+
+    removable = any(obj.M3.is_group_object for obj in sel)
+    selectable = any(obj.M3.is_group_empty or obj.M3.is_group_object for obj in sel)
+    duplicatable = any(obj.M3.is_group_empty for obj in sel)
+    groupifyable = any(obj.type == 'EMPTY' and not obj.M3.is_group_empty and obj.children for obj in sel)
 
     return bool(active_group), bool(active_child), group_empties, groupable, ungroupable, addable, removable, selectable, duplicatable, groupifyable
 
@@ -109,16 +304,11 @@ def get_group_matrix(context, objects, location_type='AVERAGE', rotation_type='W
 
     # LOCATION
 
-    if location_type == 'AVERAGE':
-        location = average_locations([obj.matrix_world.to_translation() for obj in objects])
+    if location_type == 'AVERAGE' or (location_type == 'ACTIVE' and not context.active_object):
+        location = get_average_location(objects)
 
     elif location_type == 'ACTIVE':
-        if context.active_object:
-            location = context.active_object.matrix_world.to_translation()
-
-        # fallback to average if no active object is present
-        else:
-            location = average_locations([obj.matrix_world.to_translation() for obj in objects])
+        location = context.active_object.matrix_world.to_translation()
 
     elif location_type == 'CURSOR':
         location = context.scene.cursor.location
@@ -149,6 +339,14 @@ def get_group_matrix(context, objects, location_type='AVERAGE', rotation_type='W
     return get_loc_matrix(location) @ get_rot_matrix(rotation)
 
 
+def get_average_location(objects):
+    '''
+    average the world locations of the passed in objects
+    '''
+
+    return average_locations([obj.matrix_world.translation for obj in objects])
+
+
 # HIERARCHY
 
 def select_group_children(view_layer, empty, recursive=False):
@@ -186,8 +384,22 @@ def get_child_depth(self, children, depth=0, init=False):
 
 
 def fade_group_sizes(context, size=None, groups=[], init=False):
+    '''
+    when initiated, only the hierarchies with dirty objects are faded, unless the fade factor has changed since the last time
+    '''
+
     if init:
-        groups = [obj for obj in context.scene.objects if obj.M3.is_group_empty and not obj.parent]
+        index = get_group_index(context.scene)
+        factor = r.get_prefs().group_fade_factor
+
+        if index['fade_factor'] != factor:
+            index['fade_factor'] = factor
+            groups = [obj for obj in index['empties'] if is_valid(obj) and not obj.parent]
+
+        else:
+            groups = get_root_groups(index['fade_dirty'])
+
+        index['fade_dirty'].clear()
 
     for group in groups:
         if size:
@@ -202,30 +414,124 @@ def fade_group_sizes(context, size=None, groups=[], init=False):
             fade_group_sizes(context, size=group.M3.group_size, groups=sub_groups, init=False)
 
 
+def get_root_groups(objects):
+    '''
+    get the top level group empties of the hierarchies the passed in objects are part of
+    '''
+
+    roots = set()
+    seen = set()
+
+    for obj in objects:
+        if not is_valid(obj):
+            continue
+
+        while obj.parent and obj not in seen:
+            seen.add(obj)
+            obj = obj.parent
+
+        if not obj.parent and obj.M3.is_group_empty:
+            roots.add(obj)
+
+    return list(roots)
+
+
 # NAMING
 
-def get_base_group_name():
-    p = r.get_prefs()
+def get_unique_group_name(prefix, basename, suffix):
+    '''
+    get the first free name of the {prefix}{basename}_{number}{suffix} sequence, starting at _001
+    the numbers in use and the objects using them are collected from bpy.data.objects only once per sequence, after that the search continues from the lowest number, that was free last time
+    a number is only considered used, once its name is actually taken, renames update the allocators incrementally, see update_group_name_allocators(), and removed objects invalidate them
+    '''
 
-    if r.get_prefs().group_auto_name:
-        name = f"{p.group_prefix}{p.group_basename + '_001'}{p.group_suffix}"
+    key = (prefix, basename, suffix)
+    allocator = group_name_allocators.get(key)
 
-        c = 0
-        while name in bpy.data.objects:
-            c += 1
-            name = f"{p.group_prefix}{p.group_basename + '_' + str(c).zfill(3)}{p.group_suffix}"
+    if allocator is None:
+        pattern = re.compile(f"^{re.escape(prefix + basename)}_(\\d{{3,}}){re.escape(suffix)}$")
+        allocator = group_name_allocators[key] = {'pattern': pattern,
+                                                  'owners': {},
+                                                  'numbers': {},
+                                                  'cursor': 1}
 
-        return name
+        for name, obj in bpy.data.objects.items():
+            match = pattern.match(name)
 
-    else:
-        name = f"{p.group_basename}_001"
+            if match:
+                set_group_name_owner(allocator, int(match.group(1)), obj)
+
+    number = allocator['cursor']
+
+    while True:
+        if number not in allocator['owners']:
+            name = f"{prefix}{basename}_{str(number).zfill(3)}{suffix}"
+            obj = bpy.data.objects.get(name)
+
+            if not obj:
+                allocator['cursor'] = number
+                return name
+
+            # taken since the allocator was created, possibly by the name returned last time
+            set_group_name_owner(allocator, number, obj)
+
+        number += 1
+
+
+def set_group_name_owner(allocator, number, obj):
+    ptr = obj.as_pointer()
+
+    allocator['owners'][number] = ptr
+    allocator['numbers'][ptr] = number
+
+
+def update_group_name_allocators(obj):
+    '''
+    update the allocators for a renamed object, its previous number is freed up and the new one is marked as used, if the names are part of a sequence
+    '''
+
+    ptr = obj.as_pointer()
+
+    for allocator in group_name_allocators.values():
+        number = allocator['numbers'].pop(ptr, None)
 
-        c = 0
-        while name in bpy.data.objects:
-            c += 1
-            name = f"{p.group_basename + '_' + str(c).zfill(3)}"
+        if number is not None:
+            del allocator['owners'][number]
+            allocator['cursor'] = min(allocator['cursor'], number)
 
-        return name
+        match = allocator['pattern'].match(obj.name)
+
+        if match:
+            set_group_name_owner(allocator, int(match.group(1)), obj)
+
+
+def check_group_name_allocators():
+    '''
+    invalidate the allocators, if objects have been removed, as that may have freed up numbers below the cursors
+    '''
+
+    global object_count
+
+    count = len(bpy.data.objects)
+
+    if count < object_count:
+        invalidate_group_name_allocators()
+
+    object_count = count
+
+
+def invalidate_group_name_allocators():
+    group_name_allocators.clear()
+
+
+def get_base_group_name():
+    p = r.get_prefs()
+
+    if p.group_auto_name:
+        return get_unique_group_name(p.group_prefix, p.group_basename, p.group_suffix)
+
+    else:
+        return get_unique_group_name('', p.group_basename, '')
 
 
 def update_group_name(group):
@@ -245,9 +551,7 @@ def update_group_name(group):
     if name == newname:
         return
 
-    c = 0
-    while newname in bpy.data.objects:
-        c += 1
-        newname = f"{p.group_prefix}{name + '_' + str(c).zfill(3)}{p.group_suffix}"
+    if newname in bpy.data.objects:
+        newname = get_unique_group_name(prefix, name, suffix)
 
     group.name = newname
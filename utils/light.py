@@ -1,19 +1,49 @@
 import bpy
 
 
+# the area light data blocks and the light objects, see get_light_registry()
+light_registry = {}
+
+
+def get_light_registry():
+    '''
+    get all area light data blocks and all light objects, cached
+    the area lights are invalidated, when any light changes, the light objects, when objects are added or removed, see invalidate_light_registry()
+    NOTE: invalidating just clears the stored count, a list is then rebuilt on the next call, as it is, when the count changes otherwise
+    '''
+
+    light_count = len(bpy.data.lights)
+    object_count = len(bpy.data.objects)
+
+    if light_registry.get('light_count') != light_count:
+        light_registry['area_lights'] = [light for light in bpy.data.lights if light.type == 'AREA']
+        light_registry['light_count'] = light_count
+
+    if light_registry.get('object_count') != object_count:
+        light_registry['objects'] = [obj for obj in bpy.data.objects if obj.type == 'LIGHT']
+        light_registry['object_count'] = object_count
+
+    return light_registry
+
+
+def invalidate_light_registry(area_lights=True, objects=True):
+    if area_lights:
+        light_registry.pop('light_count', None)
+
+    if objects:
+        light_registry.pop('object_count', None)
+
+
 def adjust_lights_for_rendering(mode='DECREASE'):
     divider = bpy.context.scene.M3.adjust_lights_on_render_divider
 
-    for light in bpy.data.lights:
-        if light.type == 'AREA':
-            print("", light.name, light.energy, ' > ', light.energy / divider)
-
-            if mode == 'DECREASE':
-                light.energy /= divider
+    for light in get_light_registry()['area_lights']:
+        if mode == 'DECREASE':
+            light.energy /= divider
 
-            elif mode == 'INCREASE':
-                light.energy *= divider
+        elif mode == 'INCREASE':
+            light.energy *= divider
 
 
 def get_area_light_poll():
-    return [obj for obj in bpy.data.objects if obj.type == 'LIGHT' and obj.data.type == 'AREA']
+    return [obj for obj in get_light_registry()['objects'] if obj.data.type == 'AREA']
@@ -2,11 +2,18 @@ import bpy
 from mathutils import Vector
 from . registration import get_addon
 from . math import get_sca_matrix
-from . mesh import get_bbox
+from . mesh import get_dimensions
 
 
 decalmachine = None
 
+# names of the materials used by the visible objects, see adjust_bevel_shader()
+bevel_shader_materials = set()
+
+# the visible object count at the time the materials were collected, to catch objects being hidden or unhidden, which the depsgraph handler doesn't
+bevel_shader_visible_count = None
+
+
 def get_last_node(mat):
     if mat.use_nodes:
         tree = mat.node_tree
@@ -27,9 +34,15 @@ def lighten_color(color, amount):
     return tuple(remap(c, amount) for c in color)
 
 
-def adjust_bevel_shader(context, debug=False):
+def invalidate_bevel_shader_materials():
+    bevel_shader_materials.clear()
+
+
+def adjust_bevel_shader(context, nodes_only=False, debug=False):
     '''
     go over all visible objects, to find all materials used by them
+        the materials are indexed, so with nodes_only, only the nodes of the previously found materials are adjusted, without going over the objects again
+        the index is invalidated, when objects or collections change, see invalidate_bevel_shader_materials(), or when the number of visible objects changes
     for objects without any material a "white bevel" material is created, if use_bevel_shader is True
     for each of these materiasl try to find a "Bevel" node
         if use_bevel_shader is True, and none can be found check if the last node has a normal input without any links
@@ -44,6 +57,8 @@ def adjust_bevel_shader(context, debug=False):
             remove the bevel node in the current mat, if it exists
     '''
 
+    global bevel_shader_visible_count
+
     debug = True
     debug = False
 
@@ -53,14 +68,25 @@ def adjust_bevel_shader(context, debug=False):
         print("\nadjusting bevel shader")
         print("use bevel:", m3.use_bevel_shader)
 
-    visible_objs = [obj for obj in context.visible_objects if obj.data and getattr(obj.data, 'materials', False) is not False and not any([obj.type == 'GPENCIL', obj.display_type in ['WIRE', 'BOUNDS'], obj.hide_render])]
-    # print([obj.name for obj in visible_objs])
-
     white_bevel = bpy.data.materials.get('white bevel')
     white_bevel_objs = []
 
     visible_mats = {white_bevel} if white_bevel else set()
 
+    visible_count = len(context.visible_objects)
+
+    # only the node values change, so get the materials from the index
+    if nodes_only and m3.use_bevel_shader and bevel_shader_materials and visible_count == bevel_shader_visible_count:
+        visible_mats.update(mat for mat in (bpy.data.materials.get(name) for name in bevel_shader_materials) if mat)
+        visible_objs = []
+
+    else:
+        visible_objs = [obj for obj in context.visible_objects if obj.data and getattr(obj.data, 'materials', False) is not False and not any([obj.type == 'GPENCIL', obj.display_type in ['WIRE', 'BOUNDS'], obj.hide_render])]
+        # print([obj.name for obj in visible_objs])
+
+        bevel_shader_materials.clear()
+        bevel_shader_visible_count = visible_count
+
     if debug:
         print("white bevel mat:", white_bevel)
 
@@ -97,6 +123,8 @@ def adjust_bevel_shader(context, debug=False):
         
         # collect all visible materials in a set
         visible_mats.update(mats)
+
+        bevel_shader_materials.update(mat.name for mat in mats)
         
         # set dimensions prop
         if m3.use_bevel_shader:
@@ -108,8 +136,8 @@ def adjust_bevel_shader(context, debug=False):
                 if obj.type == 'MESH':
                     # print(obj.name)
 
-                    # get mesh dimensios as vector
-                    dims = Vector(get_bbox(obj.data)[2])
+                    # get mesh dimensios as vector, cached per mesh, and only re-read when the geometry changes
+                    dims = Vector(get_dimensions(obj.data))
 
                     # get scalemx
                     scalemx = get_sca_matrix(obj.matrix_world.to_scale())
@@ -1,6 +1,7 @@
 from mathutils import Matrix, Vector
 from mathutils.geometry import intersect_line_plane
 from math import log10, floor
+import numpy as np
 
 
 # VALUE
@@ -422,6 +423,51 @@ def create_selection_bbox(coords):
     return bbox, mid
 
 
+def get_farthest_pair(coords, chunk=512):
+    '''
+    get the indices of the two most distant points of the passed in coords array, without measuring all pairs
+    a first guess is taken along the principal axis and refined once, then only points far enough from the center to still beat it are compared exactly
+    return None, if all points coincide
+    '''
+
+    center = coords.mean(axis=0)
+    centered = coords - center
+
+    # guess along the principal axis, then refine it by looking for the point farthest away from the guessed end
+    _, _, vt = np.linalg.svd(centered, full_matrices=False)
+    projected = centered @ vt[0]
+
+    j = int(projected.argmax())
+    i = int(((centered - centered[j]) ** 2).sum(axis=1).argmax())
+
+    best = ((centered[i] - centered[j]) ** 2).sum()
+
+    if not best:
+        return None
+
+    # a pair can only be farther apart than the guess, if the distances of both points to the center are too, see triangle inequality
+    radii = np.sqrt((centered ** 2).sum(axis=1))
+    candidates = np.flatnonzero(radii + radii.max() > np.sqrt(best))
+
+    if len(candidates) > 2:
+        # NOTE: the distances are expanded from the centered coords, to avoid the cancellation of large squared lengths far from the origin
+        points = centered[candidates]
+        sq_lengths = (points ** 2).sum(axis=1)
+
+        # compare the remaining candidates in chunks of rows, using squared distances, to keep the memory in check
+        for start in range(0, len(points), chunk):
+            rows = points[start:start + chunk]
+            distances = sq_lengths[start:start + chunk, None] + sq_lengths[None, :] - 2 * rows @ points.T
+
+            r, c = np.unravel_index(distances.argmax(), distances.shape)
+
+            if distances[r, c] > best:
+                best = distances[r, c]
+                i, j = int(candidates[start + r]), int(candidates[c])
+
+    return i, j
+
+
 def get_right_and_up_axes(context, mx):
     r3d = context.space_data.region_3d
 
@@ -4,6 +4,11 @@ from mathutils import Vector, Matrix
 import numpy as np
 
 
+# non-evaluated mesh dimensions and edge indices, keyed by mesh pointer, see get_dimensions() and get_edge_indices()
+mesh_dimensions = {}
+mesh_edge_indices = {}
+
+
 def get_bbox(mesh=None, coords=None):
     '''
     create mesh bounding box, not the evaluated mesh bbox like Blender's obj.bound_box does
@@ -53,46 +58,237 @@ def get_bbox(mesh=None, coords=None):
     return bbox, centers, dimensions
 
 
+def get_dimensions(mesh):
+    '''
+    get the (non-evaluated) mesh dimensions, like get_bbox() does, but cached per mesh
+    the cache entry of a mesh is invalidated, when its geometry changes, see invalidate_mesh_caches()
+    '''
+
+    key = mesh.as_pointer()
+    vert_count = len(mesh.vertices)
+
+    cached = mesh_dimensions.get(key)
+
+    if cached and cached[0] == vert_count:
+        return cached[1]
+
+    dimensions = get_bbox(mesh)[2] if vert_count else Vector()
+    mesh_dimensions[key] = (vert_count, dimensions)
+
+    return dimensions
+
+
+def invalidate_mesh_caches(meshes=None):
+    '''
+    invalidate the cached dimensions and edge indices of the passed in meshes, or of all meshes if None are passed in
+    '''
+
+    if meshes is None:
+        mesh_dimensions.clear()
+        mesh_edge_indices.clear()
+
+    else:
+        for mesh in meshes:
+            key = mesh.as_pointer()
+
+            mesh_dimensions.pop(key, None)
+            mesh_edge_indices.pop(key, None)
+
+
 def get_coords(mesh, mx=None, offset=0, indices=False):
-    verts = mesh.vertices
-    vert_count = len(verts)
+    '''
+    get the mesh's vert coords as float32, as needed for gpu drawing, optionally transformed by mx, avoiding any float64 or homogeneous copies
+    the edge indices are cached per mesh and shared between calls, so treat them as read-only
+    '''
 
-    coords = np.empty((vert_count, 3), float)
+    vert_count = len(mesh.vertices)
+
+    coords = np.empty((vert_count, 3), np.float32)
     mesh.vertices.foreach_get('co', np.reshape(coords, vert_count * 3))
 
     # offset along vertex normal
     if offset:
-        normals = np.empty((vert_count, 3), float)
+        normals = np.empty((vert_count, 3), np.float32)
         mesh.vertices.foreach_get('normal', np.reshape(normals, vert_count * 3))
 
-        coords = coords + normals * offset
+        normals *= offset
+        coords += normals
 
     # bring coords into non-local space
-    if mx:
-        coords_4d = np.ones((vert_count, 4), dtype=float)
-        coords_4d[:, :-1] = coords
+    if mx is not None:
+        mx = np.array(mx, dtype=np.float32)
 
-        coords = np.einsum('ij,aj->ai', mx, coords_4d)[:, :-1]
+        # NOTE: matmul can't write into its own input, so the result goes into a separate array
+        transformed = np.empty_like(coords)
+        np.matmul(coords, mx[:3, :3].T, out=transformed)
+        transformed += mx[:3, 3]
 
-    # float64 seems faster to calculate than 32, + the einsum turns it into 64 anyway
-    # but float32 is needed for gpu drawing, so convert
-    coords = np.float32(coords)
+        coords = transformed
 
     if indices:
-        edges = mesh.edges
-        edge_count = len(edges)
+        return coords, get_edge_indices(mesh)
+
+    return coords
 
-        indices = np.empty((edge_count, 2), 'i')
-        edges.foreach_get('vertices', np.reshape(indices, edge_count * 2))
 
-        return coords, indices
+def get_edge_indices(mesh):
+    '''
+    get the mesh's edge vert indices, cached per mesh, and invalidated when its geometry changes
+    '''
 
+    key = mesh.as_pointer()
+    edge_count = len(mesh.edges)
 
-    return coords
+    cached = mesh_edge_indices.get(key)
+
+    if cached is not None and len(cached) == edge_count:
+        return cached
+
+    indices = np.empty((edge_count, 2), 'i')
+    mesh.edges.foreach_get('vertices', np.reshape(indices, edge_count * 2))
+
+    # the indices are shared, so protect them from being modified
+    indices.flags.writeable = False
+
+    mesh_edge_indices[key] = indices
+    return indices
+
+
+def get_edge_face_angles(mesh):
+    '''
+    get the angles between the face normals of each manifold edge, like BMEdge.calc_face_angle() does
+    edges that don't have exactly two faces get nan, and so will never compare as greater than any angle
+    '''
+
+    edge_count = len(mesh.edges)
+    poly_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+
+    angles = np.full(edge_count, np.nan, dtype=np.float32)
+
+    if not poly_count:
+        return angles
+
+    normals = np.empty((poly_count, 3), np.float32)
+    mesh.polygons.foreach_get('normal', np.reshape(normals, poly_count * 3))
+
+    loop_totals = np.empty(poly_count, 'i')
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+
+    loop_edges = np.empty(loop_count, 'i')
+    mesh.loops.foreach_get('edge_index', loop_edges)
+
+    # the face index of each loop, polygon loops are stored consecutively
+    loop_faces = np.repeat(np.arange(poly_count, dtype='i'), loop_totals)
+
+    # group the loops by edge, so the faces of each edge end up next to each other
+    face_counts = np.bincount(loop_edges, minlength=edge_count)
+    edge_faces = loop_faces[np.argsort(loop_edges, kind='stable')]
+    starts = np.cumsum(face_counts) - face_counts
+
+    manifold = np.flatnonzero(face_counts == 2)
+    face1 = edge_faces[starts[manifold]]
+    face2 = edge_faces[starts[manifold] + 1]
+
+    dots = np.einsum('ij,ij->i', normals[face1], normals[face2])
+    angles[manifold] = np.arccos(np.clip(dots, -1, 1))
+
+    return angles
+
+
+def get_vgroup_edge_mask(mesh, vgroup_indices, weight=1):
+    '''
+    get a mask of the edges, whose verts are both in the same vertex group(s) with the passed in weight
+    '''
+
+    edge_count = len(mesh.edges)
+    vert_count = len(mesh.vertices)
+
+    lookup = {vgindex: idx for idx, vgindex in enumerate(vgroup_indices)}
+    vert_masks = np.zeros((len(lookup), vert_count), bool)
+
+    # NOTE: there is no bulk access to vertex group weights, but this is a single pass over the verts
+    for v in mesh.vertices:
+        for g in v.groups:
+            idx = lookup.get(g.group)
+
+            if idx is not None and g.weight == weight:
+                vert_masks[idx, v.index] = True
+
+    edge_verts = np.empty((edge_count, 2), 'i')
+    mesh.edges.foreach_get('vertices', np.reshape(edge_verts, edge_count * 2))
+
+    return np.any(vert_masks[:, edge_verts[:, 0]] & vert_masks[:, edge_verts[:, 1]], axis=0)
 
 
 # MESH
 
+def transform_mesh(mesh, mx):
+    '''
+    transform the mesh verts by a matrix in bulk
+    meshes with shape keys or custom normals go through mesh.transform(), as it takes care of those as well
+    '''
+
+    if mesh.shape_keys or mesh.has_custom_normals:
+        mesh.transform(mx)
+
+    else:
+        vert_count = len(mesh.vertices)
+
+        coords = np.empty((vert_count, 3), np.float32)
+        mesh.vertices.foreach_get('co', np.reshape(coords, vert_count * 3))
+
+        mx = np.array(mx, dtype=np.float32)
+        coords = coords @ mx[:3, :3].T + mx[:3, 3]
+
+        mesh.vertices.foreach_set('co', np.reshape(coords, vert_count * 3))
+
+    mesh.update()
+
+
+def clear_edge_data(mesh, sharps=True, bweights=True, creases=True, seams=True):
+    '''
+    clear sharps, bevel weights, creases and seams using bulk writes, instead of going through BMesh
+    '''
+
+    edge_count = len(mesh.edges)
+
+    if not edge_count:
+        return
+
+    if sharps or seams:
+        false = np.zeros(edge_count, bool)
+
+        if sharps:
+            mesh.edges.foreach_set('use_edge_sharp', false)
+
+        if seams:
+            mesh.edges.foreach_set('use_seam', false)
+
+    if bweights or creases:
+        zero = np.zeros(edge_count, np.float32)
+
+        if bpy.app.version >= (4, 0, 0):
+            for name, clear in [('bevel_weight_edge', bweights), ('crease_edge', creases)]:
+                attr = mesh.attributes.get(name)
+
+                if clear and attr:
+                    attr.data.foreach_set('value', zero)
+
+        else:
+            if bweights and mesh.use_customdata_edge_bevel:
+                mesh.edges.foreach_set('bevel_weight', zero)
+
+            if creases and mesh.use_customdata_edge_crease:
+                mesh.edges.foreach_set('crease', zero)
+
+
+def smooth(mesh, smooth=True):
+    mesh.polygons.foreach_set('use_smooth', np.full(len(mesh.polygons), smooth, bool))
+
+    mesh.update()
+
+
 def hide(mesh):
     mesh.polygons.foreach_set('hide', [True] * len(mesh.polygons))
     mesh.edges.foreach_set('hide', [True] * len(mesh.edges))
@@ -180,19 +376,6 @@ def blast(mesh, prop, type):
     bm.clear()
 
 
-def smooth(mesh, smooth=True):
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.normal_update()
-    bm.verts.ensure_lookup_table()
-
-    for f in bm.faces:
-        f.smooth = smooth
-
-    bm.to_mesh(mesh)
-    bm.free()
-
-
 def flip_normals(mesh):
     bm = bmesh.new()
     bm.from_mesh(mesh)
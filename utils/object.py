@@ -1,7 +1,9 @@
 import bpy
 import bmesh
 from mathutils import Matrix, Vector
+import numpy as np
 from . math import flatten_matrix
+from . mesh import transform_mesh
 
 
 def parent(obj, parentobj):
@@ -12,6 +14,22 @@ def parent(obj, parentobj):
     obj.matrix_parent_inverse = parentobj.matrix_world.inverted_safe()
 
 
+def parent_objects(objects, parentobj):
+    '''
+    parent multiple objects to the same parent, they all share the same parent inverse matrix, so it's only calculated once
+    NOTE: parent and parent inverse are still written per object, there is no bulk API for pointer props
+    '''
+
+    parent_inverse = parentobj.matrix_world.inverted_safe()
+
+    for obj in objects:
+        if obj.parent:
+            unparent(obj)
+
+        obj.parent = parentobj
+        obj.matrix_parent_inverse = parent_inverse
+
+
 def unparent(obj):
     if obj.parent:
         omx = obj.matrix_world.copy()
@@ -82,6 +100,24 @@ def add_facemap(obj, name="", ids=[]):
     return fmap
 
 
+def get_data_users(datas):
+    '''
+    get the objects using each of the passed in data blocks, found in a single pass over bpy.data.objects
+    unlike data.users, this doesn't count fake users or other references, like pointer props
+    '''
+
+    users = {data: [] for data in datas}
+
+    if not users:
+        return users
+
+    for obj in bpy.data.objects:
+        if obj.data in users:
+            users[obj.data].append(obj)
+
+    return users
+
+
 def set_obj_origin(obj, mx, bm=None, decalmachine=False, meshmachine=False):
     '''
     change object origin to supplied matrix, support doing it in edit mode when bmesh is passed in
@@ -109,6 +145,71 @@ def set_obj_origin(obj, mx, bm=None, decalmachine=False, meshmachine=False):
     if obj.type == 'MESH':
         obj.data.update()
 
+    update_origin_dependents(obj, omx, mx, deltamx, children, decalmachine=decalmachine, meshmachine=meshmachine)
+
+
+def set_obj_origins(origins, decalmachine=False, meshmachine=False):
+    '''
+    batch version of set_obj_origin() for object mode, taking a dict of objects and their new origin matrices
+    each data block is transformed only once, objects sharing their data with an object processed before re-use its delta matrix, and so do all other users of that data
+    stash meshes are collected and transformed in bulk at the very end too
+    '''
+
+    # the delta matrix per data block, determined by the first object using it
+    deltas = {}
+    targets = {}
+
+    for obj, mx in origins.items():
+        if obj.data in deltas:
+            targets[obj] = obj.matrix_world @ deltas[obj.data].inverted_safe()
+
+        else:
+            deltas[obj.data] = mx.inverted_safe() @ obj.matrix_world
+            targets[obj] = mx
+
+    # users of the same data outside of the passed in objects need to be compensated as well, all of them are found in a single pass
+    usercounts = {}
+
+    for obj in targets:
+        usercounts[obj.data] = usercounts.get(obj.data, 0) + 1
+
+    shared = [data for data, count in usercounts.items() if data.users > count]
+
+    if shared:
+        for data, objs in get_data_users(shared).items():
+            for obj in objs:
+                if obj not in targets:
+                    targets[obj] = obj.matrix_world @ deltas[data].inverted_safe()
+
+    # stash meshes are transformed in bulk after all objects are done
+    stash_transforms = {}
+
+    for obj, mx in targets.items():
+        omx = obj.matrix_world.copy()
+
+        children = [c for c in obj.children]
+        compensate_children(obj, omx, mx)
+
+        obj.matrix_world = mx
+
+        update_origin_dependents(obj, omx, mx, deltas[obj.data], children, decalmachine=decalmachine, meshmachine=meshmachine, stash_transforms=stash_transforms)
+
+    for data, deltamx in deltas.items():
+        if isinstance(data, bpy.types.Mesh):
+            transform_mesh(data, deltamx)
+        else:
+            data.transform(deltamx)
+
+    for mesh, deltamx in stash_transforms.items():
+        transform_mesh(mesh, deltamx)
+
+
+def update_origin_dependents(obj, omx, mx, deltamx, children, decalmachine=False, meshmachine=False, stash_transforms=None):
+    '''
+    update decal backups and stashes of an object, whose origin changed from omx to mx
+    if a stash_transforms dict is passed in, the stash meshes are only collected there with their delta matrix, instead of being transformed right away
+    '''
+
     # the decal origin needs to be chanegd too and the backupmx needs to be compensated for the change in parent object origin
     if decalmachine and children:
 
@@ -161,9 +262,83 @@ def set_obj_origin(obj, mx, bm=None, decalmachine=False, meshmachine=False):
                 stash.obj.MM.stashmx = flatten_matrix(omx @ stashdeltamx)
                 stash.obj.MM.stashtargetmx = flatten_matrix(mx)
 
-            stash.obj.data.transform(deltamx)
+            if stash_transforms is None:
+                stash.obj.data.transform(deltamx)
+
+            # NOTE: a stash mesh hit multiple times accumulates its deltas, just like it would when transformed immediately
+            else:
+                stash_transforms[stash.obj.data] = deltamx @ stash_transforms.get(stash.obj.data, Matrix())
+
             stash.obj.matrix_world = mx
 
 
 def get_eval_bbox(obj):
     return [Vector(co) for co in obj.bound_box]
+
+
+# SNAPSHOT
+
+def get_object_snapshot(objects, bounds=True):
+    '''
+    fetch the world matrices and optionally the (evaluated) local bounding boxes of the passed in objects
+    for selections that make up a good part of the file, both are read for all objects in a single foreach_get pass each, which is much faster than accessing them per object
+    small selections are read per object instead, so the cost scales with the selection and not with the file
+    return (n, 4, 4) matrices and (n, 8, 3) bounding box corners or None, in the order of the passed in objects
+    '''
+
+    objects = list(objects)
+    count = len(bpy.data.objects)
+
+    if len(objects) * 4 < count:
+        matrices = np.array([obj.matrix_world for obj in objects], np.float32).reshape(-1, 4, 4)
+        bboxes = np.array([obj.bound_box for obj in objects], np.float32).reshape(-1, 8, 3) if bounds else None
+
+        return matrices, bboxes
+
+    lookup = {obj: idx for idx, obj in enumerate(bpy.data.objects)}
+    indices = np.array([lookup[obj] for obj in objects], dtype=int)
+
+    matrices = np.empty((count, 4, 4), np.float32)
+    bpy.data.objects.foreach_get('matrix_world', np.reshape(matrices, count * 16))
+
+    if bounds:
+        bboxes = np.empty((count, 8, 3), np.float32)
+        bpy.data.objects.foreach_get('bound_box', np.reshape(bboxes, count * 24))
+
+    # the matrices are stored column major
+    return matrices[indices].transpose(0, 2, 1), bboxes[indices] if bounds else None
+
+
+def get_world_bounds(matrices, bboxes):
+    '''
+    get the world space axis aligned bounds of the passed in local bounding boxes
+    return (n, 3) min and max coordinates
+    '''
+
+    corners = np.einsum('nij,nkj->nki', matrices[:, :3, :3], bboxes) + matrices[:, None, :3, 3]
+    return corners.min(axis=1), corners.max(axis=1)
+
+
+def get_world_z_minima(objects, matrices):
+    '''
+    get the lowest world space Z coordinate of each passed in mesh object's verts
+    the vert coords of meshes shared by multiple objects are only fetched once
+    objects without verts get nan
+    '''
+
+    minima = np.full(len(objects), np.nan)
+    coords = {}
+
+    for idx, (obj, mx) in enumerate(zip(objects, matrices)):
+        mesh = obj.data
+
+        if mesh not in coords:
+            vert_count = len(mesh.vertices)
+
+            coords[mesh] = np.empty((vert_count, 3), np.float32)
+            mesh.vertices.foreach_get('co', np.reshape(coords[mesh], vert_count * 3))
+
+        if len(coords[mesh]):
+            minima[idx] = (coords[mesh] @ mx[2, :3]).min() + mx[2, 3]
+
+    return minima
@@ -1,6 +1,7 @@
 import bpy
 from bpy.utils import register_class, unregister_class, previews
 import os
+import time
 from importlib import import_module
 from .. registration import keys as keysdict
 from .. registration import classes as classesdict
@@ -19,31 +20,53 @@ def get_prefs():
     return bpy.context.preferences.addons[get_name()].preferences
 
 
+addons = None
+enabled_addons = None
+addons_scan_time = 0
+
+# the installed addons are rescanned at most this often in seconds, to pick up addons installed, removed or updated in the meantime
+addons_rescan_interval = 30
+
+
 def get_addon(addon, debug=False):
     """
     look for addon by name
     return registration status, foldername, version and path
+
+    NOTE: scanning the installed addons can involve the file system, so they are only scanned once and then looked up by name
+    ####: the scan is repeated, whenever the enabled addons change, and otherwise at most once every addons_rescan_interval seconds, to pick up installed, removed or updated addons
     """
     import addon_utils
 
+    global addons, enabled_addons, addons_scan_time
 
-    for mod in addon_utils.modules():
-        name = mod.bl_info["name"]
-        version = mod.bl_info.get("version", None)
-        foldername = mod.__name__
-        path = mod.__file__
-        enabled = addon_utils.check(foldername)[1]
+    enabled_keys = tuple(bpy.context.preferences.addons.keys())
+    now = time.time()
 
-        if name == addon:
-            if debug:
-                print(name)
-                print("  enabled:", enabled)
-                print("  folder name:", foldername)
-                print("  version:", version)
-                print("  path:", path)
-                print()
+    if addons is None or enabled_keys != enabled_addons or now - addons_scan_time > addons_rescan_interval:
+        addons = {}
+        enabled_addons = enabled_keys
+        addons_scan_time = now
 
-            return enabled, foldername, version, path
+        for mod in addon_utils.modules():
+            name = mod.bl_info["name"]
+
+            if name not in addons:
+                addons[name] = (mod.__name__, mod.bl_info.get("version", None), mod.__file__)
+
+    if addon in addons:
+        foldername, version, path = addons[addon]
+        enabled = addon_utils.check(foldername)[1]
+
+        if debug:
+            print(addon)
+            print("  enabled:", enabled)
+            print("  folder name:", foldername)
+            print("  version:", version)
+            print("  path:", path)
+            print()
+
+        return enabled, foldername, version, path
     return False, None, None, None
 
 
@@ -1,5 +1,6 @@
 from mathutils import Matrix, Vector
 from bpy_extras.view3d_utils import location_3d_to_region_2d
+from . light import get_light_registry
 
 
 def set_xray(context):
@@ -34,6 +35,50 @@ def update_local_view(space_data, states):
                 obj.local_view_set(space_data, local)
 
 
+def add_focus_epoch(history, visible, hidden):
+    '''
+    add a new epoch to the focus history
+    instead of all the hidden objects, an epoch stores the usually much smaller set of objects, that remain visible
+    hidden objects are only stored, if they weren't visible in the previous epoch already, for instance because they were added in local view
+    for the first epoch nothing hidden needs to be stored at all, as exiting local view restores everything
+    '''
+
+    prev_visible = {entry.obj for entry in history[-1].visible} if history else None
+
+    epoch = history.add()
+    epoch.name = "Epoch %d" % (len(history) - 1)
+
+    for obj in visible:
+        entry = epoch.visible.add()
+        entry.obj = obj
+        entry.name = obj.name
+
+    if prev_visible is not None:
+        for obj in hidden:
+            if obj not in prev_visible:
+                entry = epoch.objects.add()
+                entry.obj = obj
+                entry.name = obj.name
+
+    return epoch
+
+
+def get_focus_epoch_hidden(history):
+    '''
+    get the objects hidden by the last epoch of the focus history, by comparing its visible objects to the ones of the previous epoch
+    epochs created before visible objects were stored, simply have all hidden objects stored
+    '''
+
+    last_epoch = history[-1]
+    hidden = [entry.obj for entry in last_epoch.objects if entry.obj]
+
+    if len(history) > 1:
+        visible = {entry.obj for entry in last_epoch.visible}
+        hidden.extend(entry.obj for entry in history[-2].visible if entry.obj and entry.obj not in visible)
+
+    return hidden
+
+
 def reset_viewport(context, disable_toolbar=False):
     for screen in context.workspace.screens:
         for area in screen.areas:
@@ -56,15 +101,21 @@ def reset_viewport(context, disable_toolbar=False):
 def sync_light_visibility(scene):
     '''
     set light's hide_render prop based on light's hide_get()
+    the light objects are taken from the light registry, rather than from all objects of each view layer
     '''
 
     # print("syncing light visibility/renderability")
 
-    for view_layer in scene.view_layers:
-        lights = [obj for obj in view_layer.objects if obj.type == 'LIGHT']
+    lights = get_light_registry()['objects']
 
+    for view_layer in scene.view_layers:
         for light in lights:
-            hidden = light.hide_get(view_layer=view_layer)
+
+            # lights not in the view layer can't be queried
+            try:
+                hidden = light.hide_get(view_layer=view_layer)
+            except RuntimeError:
+                continue
 
             if light.hide_render != hidden:
                 light.hide_render = hidden